@@ -0,0 +1,317 @@
+"""
+Parallel batch renderer for every scene under examples/.
+
+Running `manim` once per scene pays the full library import for each one.
+This script finds every Scene subclass in the given files (by reading the
+source, without importing it), renders them on a pool of long-lived worker
+processes that import manim once, and skips scenes whose source and render
+settings are unchanged since the last run. A JSON manifest records the hash,
+status, output path and timing of every scene.
+
+Run with:
+    python batch_render.py                      # every scene in this folder
+    python batch_render.py quicksort.py -q h -j 8
+    python batch_render.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import importlib.metadata
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+HERE = Path(__file__).absolute().parent
+
+SCENE_BASES = {
+    "Scene",
+    "MovingCameraScene",
+    "ThreeDScene",
+    "ZoomedScene",
+    "VectorScene",
+    "LinearTransformationScene",
+    "SpecialThreeDScene",
+}
+
+
+@dataclass
+class SceneJob:
+    path: str
+    scene: str
+    source_hash: str
+
+    @property
+    def key(self) -> str:
+        return f"{Path(self.path).name}::{self.scene}"
+
+
+@dataclass
+class SceneResult:
+    key: str
+    hash: str
+    status: str  # "ok", "failed" or "skipped"
+    seconds: float = 0.0
+    output: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class _ClassInfo:
+    bases: list[str]
+    has_construct: bool
+
+
+def _module_classes(path: Path) -> tuple[dict[str, _ClassInfo], dict[str, Path]]:
+    """Top-level classes of a file, and the names it imports from sibling modules."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    classes = {}
+    imported = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            bases = [b.id if isinstance(b, ast.Name) else getattr(b, "attr", "") for b in node.bases]
+            has_construct = any(
+                isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name == "construct"
+                for item in node.body
+            )
+            classes[node.name] = _ClassInfo(bases, has_construct)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            sibling = path.parent / f"{node.module.split('.')[0]}.py"
+            if sibling.exists():
+                for alias in node.names:
+                    imported[alias.asname or alias.name] = sibling
+    return classes, imported
+
+
+def discover_scenes(paths: list[Path]) -> list[SceneJob]:
+    """
+    Find renderable Scene subclasses, resolving bases imported from sibling modules.
+
+    A class counts when it descends from a manim scene class and defines or
+    inherits its own ``construct``; mixins such as ``ProfiledScene`` have none
+    (``Scene.construct`` is empty) and are skipped. Private (``_``-prefixed)
+    classes are helpers, not scenes to render on their own.
+    """
+    modules: dict[Path, tuple[dict[str, _ClassInfo], dict[str, Path]]] = {}
+
+    def module(path: Path) -> tuple[dict[str, _ClassInfo], dict[str, Path]]:
+        if path not in modules:
+            modules[path] = _module_classes(path)
+        return modules[path]
+
+    def lookup(path: Path, name: str) -> tuple[Path, _ClassInfo] | None:
+        classes, imported = module(path)
+        if name in classes:
+            return path, classes[name]
+        if name in imported:
+            return lookup(imported[name], name)
+        return None
+
+    def resolve(path: Path, name: str, seen: frozenset[tuple[Path, str]] = frozenset()) -> tuple[bool, bool]:
+        """(is a scene, has a construct) for class ``name`` as seen from ``path``."""
+        found = lookup(path, name)
+        if found is None or (found[0], name) in seen:
+            return name in SCENE_BASES, False
+        where, info = found
+        is_scene, has_construct = False, info.has_construct
+        for base in info.bases:
+            base_scene, base_construct = resolve(where, base, seen | {(where, name)})
+            is_scene |= base_scene
+            has_construct |= base_construct
+        return is_scene, has_construct
+
+    jobs = []
+    for path in paths:
+        classes, _ = module(path)
+        source_hash = hash_sources(path)
+        for name in classes:
+            if name.startswith("_") or name in SCENE_BASES:
+                continue
+            if resolve(path, name) == (True, True):
+                jobs.append(SceneJob(str(path), name, source_hash))
+    return jobs
+
+
+def hash_sources(path: Path, seen: set[Path] | None = None) -> str:
+    """Hash a scene file together with the sibling modules it imports."""
+    seen = set() if seen is None else seen
+    seen.add(path)
+    digest = hashlib.sha256(path.read_bytes())
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            sibling = path.parent / f"{module.split('.')[0]}.py"
+            if sibling.exists() and sibling not in seen:
+                digest.update(hash_sources(sibling, seen).encode())
+    return digest.hexdigest()[:16]
+
+
+def settings_hash(settings: dict[str, Any]) -> str:
+    try:
+        manim_version = importlib.metadata.version("manim")
+    except importlib.metadata.PackageNotFoundError:
+        manim_version = "unknown"
+    payload = json.dumps({**settings, "manim": manim_version}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _warm_worker() -> None:
+    """Pay the manim import once per worker instead of once per scene."""
+    import lazy_manim
+
+    for name in ("Scene", "VMobject", "Text", "Animation"):
+        getattr(lazy_manim, name)
+
+
+def _render_job(job: SceneJob, job_hash: str, settings: dict[str, Any]) -> SceneResult:
+    import lazy_manim
+
+    options = dict(settings)
+    quality = options.pop("quality")
+    start = time.perf_counter()
+    try:
+        scene = lazy_manim.render(job.path, job.scene, quality, **options)
+    except Exception as exc:  # one broken scene must not stop the batch
+        return SceneResult(job.key, job_hash, "failed", time.perf_counter() - start, error=f"{type(exc).__name__}: {exc}")
+
+    writer = scene.renderer.file_writer
+    output = getattr(writer, "movie_file_path", None) or getattr(writer, "image_file_path", None)
+    return SceneResult(job.key, job_hash, "ok", time.perf_counter() - start, output=str(output) if output else None)
+
+
+def _render_pool(
+    jobs: list[tuple[SceneJob, str]],
+    settings: dict[str, Any],
+    workers: int,
+    record: Callable[[SceneResult], None],
+) -> list[tuple[SceneJob, str]]:
+    """Render ``jobs`` on a worker pool, passing results to ``record``; return the jobs lost to a crash."""
+    crashed = []
+    # spawn keeps workers independent of the parent's state on every platform.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_warm_worker) as pool:
+        futures = {pool.submit(_render_job, job, job_hash, settings): (job, job_hash) for job, job_hash in jobs}
+        for future in as_completed(futures):
+            try:
+                record(future.result())
+            except BrokenProcessPool:
+                crashed.append(futures[future])
+    return crashed
+
+
+def load_manifest(path: Path) -> dict[str, Any]:
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"scenes": {}}
+
+
+def write_manifest(path: Path, manifest: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def run_batch(
+    jobs: list[SceneJob],
+    settings: dict[str, Any],
+    manifest_path: Path,
+    workers: int | None = None,
+    force: bool = False,
+) -> list[SceneResult]:
+    manifest = load_manifest(manifest_path)
+    previous = manifest["scenes"]
+    config_hash = settings_hash(settings)
+    results: list[SceneResult] = []
+    pending: list[tuple[SceneJob, str]] = []
+
+    for job in jobs:
+        job_hash = f"{job.source_hash}-{config_hash}"
+        entry = previous.get(job.key)
+        up_to_date = (
+            entry is not None
+            and entry["hash"] == job_hash
+            and entry["status"] == "ok"
+            and (entry.get("output") is None or Path(entry["output"]).exists())
+        )
+        if up_to_date and not force:
+            results.append(SceneResult(job.key, job_hash, "skipped", 0.0, entry.get("output")))
+        else:
+            pending.append((job, job_hash))
+
+    def record(result: SceneResult) -> None:
+        results.append(result)
+        previous[result.key] = asdict(result)
+        write_manifest(manifest_path, manifest)  # keep progress if interrupted
+        print(f"[{result.status:>6}] {result.key} ({result.seconds:.1f}s)")
+        if result.error:
+            print(f"         {result.error}")
+
+    started = time.perf_counter()
+    if pending:
+        crashed = _render_pool(pending, settings, min(workers or os.cpu_count() or 1, len(pending)), record)
+        # A dead worker (segfault, OOM kill) breaks the whole pool, failing every
+        # job still queued. Retry those one per fresh worker, so only the job
+        # that actually crashes is recorded as failed.
+        for item in crashed:
+            for job, job_hash in _render_pool([item], settings, 1, record):
+                record(SceneResult(job.key, job_hash, "failed", error="worker process crashed"))
+
+    manifest["settings"] = settings
+    manifest["last_run"] = {
+        "wall_seconds": round(time.perf_counter() - started, 3),
+        "rendered": sum(r.status == "ok" for r in results),
+        "failed": sum(r.status == "failed" for r in results),
+        "skipped": sum(r.status == "skipped" for r in results),
+    }
+    write_manifest(manifest_path, manifest)
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Render every scene in parallel, skipping unchanged ones.")
+    parser.add_argument("files", nargs="*", type=Path, help="scene files (default: every .py next to this script)")
+    parser.add_argument("-q", "--quality", choices=["l", "m", "h", "p", "k"], default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--format", default="mp4", choices=["mp4", "mov", "webm", "gif", "png"])
+    parser.add_argument("--media-dir", type=Path, default=Path("media"))
+    parser.add_argument("--manifest", type=Path, default=None, help="default: <media-dir>/batch_manifest.json")
+    parser.add_argument("--force", action="store_true", help="render even if nothing changed")
+    parser.add_argument("--list", action="store_true", help="only list discovered scenes")
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted(HERE.glob("*.py"))
+    jobs = discover_scenes([f.absolute() for f in files])
+    if args.list:
+        for job in jobs:
+            print(job.key)
+        return
+
+    settings = {"quality": args.quality, "format": args.format, "media_dir": str(args.media_dir.absolute())}
+    manifest = args.manifest or args.media_dir / "batch_manifest.json"
+    results = run_batch(jobs, settings, manifest, workers=args.jobs, force=args.force)
+
+    counts = {status: sum(r.status == status for r in results) for status in ("ok", "skipped", "failed")}
+    print(
+        f"{len(results)} scenes: {counts['ok']} rendered, {counts['skipped']} skipped, "
+        f"{counts['failed']} failed -> {manifest}"
+    )
+    if counts["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
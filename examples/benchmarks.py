@@ -0,0 +1,309 @@
+"""
+Benchmark suite for the example scenes.
+
+Measures:
+- `QuickSortBars.build_events` and `build_bars` from n=14 up to n=5,000
+- end-to-end frames per second for QuickSortBars, ProcessHighlight,
+  CyclicStates and GraphExample (plus PooledQuickSortBars) at -ql and -qh
+- peak RSS for every case, and a checksum of each scene's last frame
+
+Each case runs in a fresh interpreter, so peak RSS belongs to that case
+alone and a case that runs out of memory is recorded as failed instead of
+stopping the suite. Results are JSON; `compare` flags cases that got slower
+or bigger than a baseline by more than a threshold, and scenes whose last
+frame changed.
+
+Run with:
+    python benchmarks.py run -o media/benchmarks/baseline.json
+    python benchmarks.py run --quick -o media/benchmarks/new.json
+    python benchmarks.py compare media/benchmarks/baseline.json media/benchmarks/new.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.metadata
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+HERE = Path(__file__).absolute().parent
+
+SIZES = [14, 100, 500, 1000, 2000, 5000]
+QUICK_SIZES = [14, 100, 500]
+SCENES = [
+    ("quicksort.py", "QuickSortBars"),
+    ("flowchart.py", "ProcessHighlight"),
+    ("state_diagram.py", "CyclicStates"),
+    ("basic_scene.py", "GraphExample"),
+    ("mobject_pool.py", "PooledQuickSortBars"),
+]
+QUALITIES = ["l", "h"]
+
+
+@dataclass
+class Case:
+    name: str
+    kind: str  # "micro" or "scene"
+    target: str  # builder name, or scene file
+    n: int = 0
+    scene: str = ""
+    quality: str = "l"
+
+
+@dataclass
+class CaseResult:
+    name: str
+    status: str  # "ok" or "failed"
+    seconds: float | None = None
+    peak_rss_mb: float | None = None
+    frames: int | None = None
+    fps: float | None = None
+    checksum: str | None = None
+    error: str | None = None
+
+
+def default_cases(quick: bool = False, max_n: int | None = None) -> list[Case]:
+    sizes = [n for n in (QUICK_SIZES if quick else SIZES) if max_n is None or n <= max_n]
+    cases = [
+        Case(f"micro/{builder}/n={n}", "micro", builder, n=n)
+        for builder in ("build_events", "build_bars")
+        for n in sizes
+    ]
+    for quality in QUALITIES[:1] if quick else QUALITIES:
+        cases += [Case(f"scene/{scene}/-q{quality}", "scene", path, scene=scene, quality=quality) for path, scene in SCENES]
+    return cases
+
+
+def frame_checksum(frame: Any) -> str:
+    """Hash of the frame averaged over 8x8 blocks and rounded to 32 levels.
+
+    Coarse enough to ignore antialiasing noise between runs, fine enough to
+    catch moved, recolored or missing objects.
+    """
+    import numpy as np
+
+    rgb = np.asarray(frame)[..., :3].astype(np.float32)
+    h, w = (rgb.shape[0] // 8) * 8, (rgb.shape[1] // 8) * 8
+    blocks = rgb[:h, :w].reshape(h // 8, 8, w // 8, 8, 3).mean(axis=(1, 3))
+    return hashlib.sha256((blocks // 8).astype(np.uint8).tobytes()).hexdigest()[:16]
+
+
+# -- inside the child process -----------------------------------------------------
+
+
+def _time_best(func, min_seconds: float = 0.2, max_repeats: int = 5) -> float:
+    """Best of several runs; large cases that take long run once."""
+    best = float("inf")
+    spent = 0.0
+    for _ in range(max_repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best, spent = min(best, elapsed), spent + elapsed
+        if spent >= min_seconds:
+            break
+    return best
+
+
+def _run_micro(case: Case) -> CaseResult:
+    from quicksort import Event, QuickSortBars
+
+    data = list(range(1, case.n + 1))
+    random.Random(case.n).shuffle(data)
+    # The builders don't touch renderer state, so skip Scene.__init__.
+    scene = object.__new__(QuickSortBars)
+
+    if case.target == "build_events":
+        seconds = _time_best(lambda: scene.build_events(data))
+    else:
+        event = Event(data, 0, case.n - 1, case.n - 1, (0,), (), (), "", "compare", 0, 1, 1, 0)
+        seconds = _time_best(lambda: scene.build_bars(event, case.n, case.n))
+    return CaseResult(case.name, "ok", seconds=seconds)
+
+
+def _run_scene(case: Case) -> CaseResult:
+    import lazy_manim
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    with tempfile.TemporaryDirectory() as media_dir:
+        start = time.perf_counter()
+        scene = lazy_manim.render(
+            HERE / case.target, case.scene, case.quality, disable_caching=True, media_dir=media_dir
+        )
+        seconds = time.perf_counter() - start
+
+    fps = MANIM_QUALITIES[lazy_manim.QUALITIES[case.quality]]["frame_rate"]
+    frames = round(scene.renderer.time * fps)
+    return CaseResult(
+        case.name,
+        "ok",
+        seconds=seconds,
+        frames=frames,
+        fps=frames / seconds if seconds else None,
+        checksum=frame_checksum(scene.renderer.get_frame()),
+    )
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _child(case_json: str) -> None:
+    sys.path.insert(0, str(HERE))
+    case = Case(**json.loads(case_json))
+    result = _run_micro(case) if case.kind == "micro" else _run_scene(case)
+    result.peak_rss_mb = _peak_rss_mb()
+    print(json.dumps(asdict(result)))
+
+
+# -- parent -----------------------------------------------------------------------
+
+
+def run_case(case: Case, timeout: float | None = None) -> CaseResult:
+    """Run one case in a fresh interpreter, so its peak RSS is its own."""
+    try:
+        proc = subprocess.run(
+            [sys.executable, __file__, "_case", json.dumps(asdict(case))],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        return CaseResult(case.name, "failed", error=f"timed out after {timeout:.0f}s")
+
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        # A negative code is a signal, e.g. -9 when the OOM killer stepped in.
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit code {proc.returncode}"
+        return CaseResult(case.name, "failed", error=error)
+    return CaseResult(**json.loads(lines[-1]))
+
+
+def environment() -> dict[str, Any]:
+    versions = {}
+    for package in ("manim", "numpy", "pycairo", "manimpango", "av"):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "packages": versions,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run_suite(cases: list[Case], timeout: float | None = None) -> dict[str, Any]:
+    results = {}
+    for case in cases:
+        result = run_case(case, timeout)
+        results[case.name] = asdict(result)
+        detail = f"{result.seconds * 1000:10.1f} ms" if result.seconds is not None else f"  {result.error}"
+        if result.fps is not None:
+            detail += f"  {result.fps:6.1f} fps"
+        if result.peak_rss_mb is not None:
+            detail += f"  {result.peak_rss_mb:8.1f} MB"
+        print(f"[{result.status:>6}] {case.name:<36}{detail}")
+    return {"environment": environment(), "results": results}
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.1) -> list[str]:
+    """Regressions of ``current`` against ``baseline``; empty if none."""
+    problems = []
+    for name, old in baseline["results"].items():
+        new = current["results"].get(name)
+        if new is None or old["status"] != "ok":
+            continue
+        if new["status"] != "ok":
+            problems.append(f"{name}: now fails ({new['error']})")
+            continue
+        for metric, label in (("seconds", "time"), ("peak_rss_mb", "peak RSS")):
+            if old.get(metric) and new.get(metric) and new[metric] > old[metric] * (1 + threshold):
+                problems.append(f"{name}: {label} {old[metric]:.4g} -> {new[metric]:.4g} (+{new[metric] / old[metric] - 1:.0%})")
+        if old.get("checksum") and new.get("checksum") and old["checksum"] != new["checksum"]:
+            problems.append(f"{name}: last frame changed ({old['checksum']} -> {new['checksum']})")
+
+    if baseline.get("environment", {}).get("packages") != current.get("environment", {}).get("packages"):
+        # Different cairo/pango builds can shift pixels; times are only comparable on one machine.
+        print("note: package versions differ from the baseline")
+    return problems
+
+
+def scaling_table(report: dict[str, Any]) -> str:
+    """Time per builder across n, with the growth factor between consecutive sizes."""
+    rows: dict[str, list[tuple[int, float]]] = {}
+    for name, result in report["results"].items():
+        kind, builder, size = (name.split("/") + ["", ""])[:3]
+        if kind == "micro" and result["status"] == "ok":
+            rows.setdefault(builder, []).append((int(size.removeprefix("n=")), result["seconds"]))
+    lines = []
+    for builder, points in rows.items():
+        points.sort()
+        cells = [f"n={n}: {s * 1000:.2f} ms" + (f" (x{s / points[i - 1][1]:.1f})" if i else "") for i, (n, s) in enumerate(points)]
+        lines.append(f"{builder}: " + ", ".join(cells))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the example scenes and compare against a baseline.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = sub.add_parser("run", help="run the suite and write JSON results")
+    run_cmd.add_argument("-o", "--output", type=Path, default=Path("media") / "benchmarks" / "results.json")
+    run_cmd.add_argument("--quick", action="store_true", help="small sizes and -ql scenes only")
+    run_cmd.add_argument("--max-n", type=int, default=None, help="skip builder sizes above this")
+    run_cmd.add_argument("-k", "--filter", default="", help="only cases whose name contains this")
+    run_cmd.add_argument("--timeout", type=float, default=1800, help="seconds per case")
+
+    compare_cmd = sub.add_parser("compare", help="exit 1 if results regressed against a baseline")
+    compare_cmd.add_argument("baseline", type=Path)
+    compare_cmd.add_argument("current", type=Path)
+    compare_cmd.add_argument("--threshold", type=float, default=0.1, help="allowed relative slowdown (0.1 = 10%%)")
+
+    case_cmd = sub.add_parser("_case")  # internal: one case in a child process
+    case_cmd.add_argument("case")
+
+    args = parser.parse_args(argv)
+    if args.command == "_case":
+        _child(args.case)
+    elif args.command == "run":
+        cases = [c for c in default_cases(args.quick, args.max_n) if args.filter in c.name]
+        report = run_suite(cases, args.timeout)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        table = scaling_table(report)
+        if table:
+            print(table)
+        print(f"results written to {args.output}")
+    else:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        current = json.loads(args.current.read_text(encoding="utf-8"))
+        problems = compare(baseline, current, args.threshold)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            raise SystemExit(1)
+        print(f"no regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,33 @@ Flowchart animation patterns for technical blogs.
 Run with: manim -pql flowchart.py SimpleFlow
 """
 
-from manim import *
+# Explicit names (not a star import) so lazy_manim only loads what this file uses.
+from manim import (
+    Arrow,
+    BLUE,
+    DL,
+    DOWN,
+    DR,
+    FadeIn,
+    GRAY,
+    GREEN,
+    GrowArrow,
+    GrowFromCenter,
+    LEFT,
+    PI,
+    PURPLE,
+    RED,
+    RIGHT,
+    RoundedRectangle,
+    Scene,
+    Square,
+    Text,
+    UL,
+    UP,
+    UR,
+    VGroup,
+    YELLOW,
+)
 
 
 def make_node(label, color=BLUE, width=2, height=1):
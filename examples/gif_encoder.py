@@ -0,0 +1,346 @@
+"""
+Palette-optimized, frame-differencing GIF encoder for blog exports.
+
+`--format=gif` stores every frame in full. Algorithm visualizations are
+mostly static: a few bars move while the background, legend and labels stay
+put. This encoder:
+
+- builds one global palette (median cut) from sampled frames,
+- quantizes frames with a NumPy lookup table (no per-pixel Python),
+- stores only the bounding box of pixels that changed since the previous
+  frame, with unchanged pixels inside it marked transparent,
+- merges identical consecutive frames into one frame with a longer delay.
+
+Render an MP4 as usual, then convert it:
+    manim -qm quicksort.py QuickSortBars
+    python gif_encoder.py media/videos/quicksort/720p30/QuickSortBars.mp4 --fps 15 --height 480
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+import numpy as np
+
+BITS = 5  # histogram / lookup precision per channel
+TRANSPARENT = 255  # palette index reserved for "unchanged since last frame"
+MAX_COLORS = 255
+
+
+@dataclass
+class GifStats:
+    frames_in: int = 0
+    frames_written: int = 0
+    frames_merged: int = 0
+    pixels_total: int = 0
+    pixels_encoded: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+
+
+class ColorHistogram:
+    """Accumulates a reduced-precision color histogram over sampled frames."""
+
+    def __init__(self):
+        size = 1 << (3 * BITS)
+        self.counts = np.zeros(size, dtype=np.int64)
+        self.sums = np.zeros((size, 3), dtype=np.int64)
+
+    def add(self, frame: np.ndarray, max_pixels: int = 250_000) -> None:
+        rgb = _rgb(frame).reshape(-1, 3)
+        if len(rgb) > max_pixels:
+            rgb = rgb[:: len(rgb) // max_pixels + 1]
+        keys = _keys(rgb)
+        self.counts += np.bincount(keys, minlength=self.counts.size)
+        for channel in range(3):
+            self.sums[:, channel] += np.bincount(keys, weights=rgb[:, channel], minlength=self.counts.size).astype(
+                np.int64
+            )
+
+    def palette(self, colors: int = MAX_COLORS) -> np.ndarray:
+        """Median-cut the histogram into at most ``colors`` RGB entries."""
+        used = np.flatnonzero(self.counts)
+        if used.size == 0:
+            return np.zeros((1, 3), dtype=np.uint8)
+        weights = self.counts[used]
+        means = self.sums[used] / weights[:, None]
+        if used.size <= colors:
+            # Flat-color scenes: keep every color exactly.
+            return np.round(means).astype(np.uint8)
+
+        boxes = [np.arange(used.size)]
+        while len(boxes) < colors:
+            # Split the box with the most weighted spread along its widest channel.
+            scores = [
+                np.ptp(means[box], axis=0).max() * weights[box].sum() if box.size > 1 else -1 for box in boxes
+            ]
+            i = int(np.argmax(scores))
+            if scores[i] <= 0:
+                break
+            box = boxes.pop(i)
+            channel = int(np.argmax(np.ptp(means[box], axis=0)))
+            box = box[np.argsort(means[box, channel], kind="stable")]
+            cumulative = np.cumsum(weights[box])
+            cut = int(np.searchsorted(cumulative, cumulative[-1] / 2)) + 1
+            cut = min(max(cut, 1), box.size - 1)
+            boxes += [box[:cut], box[cut:]]
+
+        return np.array(
+            [np.round(np.average(means[box], axis=0, weights=weights[box])) for box in boxes], dtype=np.uint8
+        )
+
+
+def palette_lut(palette: np.ndarray) -> np.ndarray:
+    """Nearest palette index for every reduced-precision color."""
+    levels = (np.arange(1 << BITS) << (8 - BITS)) + (1 << (7 - BITS))
+    grid = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+    lut = np.empty(len(grid), dtype=np.uint8)
+    pal = palette.astype(np.int32)
+    for start in range(0, len(grid), 4096):
+        chunk = grid[start : start + 4096, None, :] - pal[None, :, :]
+        lut[start : start + 4096] = np.argmin((chunk * chunk).sum(axis=2), axis=1)
+    return lut
+
+
+def quantize(frame: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    rgb = _rgb(frame)
+    return lut[_keys(rgb.reshape(-1, 3))].reshape(rgb.shape[:2])
+
+
+def _rgb(frame: np.ndarray) -> np.ndarray:
+    return frame[..., :3]  # manim frames are RGBA
+
+
+def _keys(rgb: np.ndarray) -> np.ndarray:
+    shift = 8 - BITS
+    rgb = rgb.astype(np.int32) >> shift
+    return (rgb[:, 0] << (2 * BITS)) | (rgb[:, 1] << BITS) | rgb[:, 2]
+
+
+def lzw_encode(data: bytes, min_code_size: int = 8) -> bytes:
+    """GIF-flavoured variable-width LZW."""
+    clear, end = 1 << min_code_size, (1 << min_code_size) + 1
+    out = bytearray()
+    width = min_code_size + 1
+    next_code = end + 1
+    table: dict[int, int] = {}
+    bits, nbits = clear, width
+
+    prefix = data[0]
+    for byte in data[1:]:
+        key = (prefix << 8) | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        bits |= prefix << nbits
+        nbits += width
+        if next_code < 4096:
+            table[key] = next_code
+            if next_code == 1 << width:
+                width += 1
+            next_code += 1
+        else:
+            bits |= clear << nbits
+            nbits += width
+            table.clear()
+            width, next_code = min_code_size + 1, end + 1
+        while nbits >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            nbits -= 8
+        prefix = byte
+
+    for code in (prefix, end):
+        bits |= code << nbits
+        nbits += width
+    while nbits > 0:
+        out.append(bits & 0xFF)
+        bits >>= 8
+        nbits -= 8
+    return bytes(out)
+
+
+class GifWriter:
+    """
+    Streaming GIF89a writer with a fixed global palette.
+
+    Usage:
+        with GifWriter("out.gif", (width, height), palette, fps=15) as gif:
+            for frame in frames:
+                gif.write(frame)
+        print(gif.stats)
+    """
+
+    def __init__(self, path: Path | str, size: tuple[int, int], palette: np.ndarray, fps: float, loop: int = 0):
+        if not 0 < fps <= 50:
+            # Delays are stored in 1/100 s and browsers slow down anything below 2.
+            raise ValueError(f"GIF fps must be in (0, 50], got {fps}")
+        if len(palette) > MAX_COLORS:
+            raise ValueError(f"palette has {len(palette)} colors, at most {MAX_COLORS} fit next to transparency")
+        self.path = Path(path)
+        self.width, self.height = size
+        self.fps = fps
+        self.lut = palette_lut(palette)
+        self.stats = GifStats()
+
+        self._canvas: np.ndarray | None = None
+        self._pending: tuple[int, int, np.ndarray, bool] | None = None
+        self._pending_start = 0
+        self._file: BinaryIO = self.path.open("wb")
+        self._start = time.perf_counter()
+        self._write_header(palette, loop)
+
+    def write(self, frame: np.ndarray) -> None:
+        indices = quantize(frame, self.lut)
+        if indices.shape != (self.height, self.width):
+            raise ValueError(f"frame is {indices.shape[1]}x{indices.shape[0]}, expected {self.width}x{self.height}")
+        index = self.stats.frames_in
+        self.stats.frames_in += 1
+        self.stats.pixels_total += indices.size
+
+        if self._canvas is None:
+            self._queue(index, 0, 0, indices, transparent=False)
+        else:
+            changed = indices != self._canvas
+            rows = np.flatnonzero(changed.any(axis=1))
+            if rows.size == 0:
+                self.stats.frames_merged += 1  # extends the pending frame's delay
+                return
+            cols = np.flatnonzero(changed.any(axis=0))
+            y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+            patch = np.where(changed[y0:y1, x0:x1], indices[y0:y1, x0:x1], TRANSPARENT).astype(np.uint8)
+            self._queue(index, x0, y0, patch, transparent=True)
+        self._canvas = indices
+
+    def close(self) -> GifStats:
+        if self._file.closed:
+            return self.stats
+        self._flush(self.stats.frames_in)
+        self._file.write(b";")
+        self.stats.bytes_written = self._file.tell()
+        self._file.close()
+        self.stats.seconds = time.perf_counter() - self._start
+        return self.stats
+
+    def __enter__(self) -> GifWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _queue(self, index: int, x: int, y: int, patch: np.ndarray, transparent: bool) -> None:
+        # A frame's delay is only known once the next different frame arrives.
+        self._flush(index)
+        self._pending = (int(x), int(y), patch, transparent)
+        self._pending_start = index
+
+    def _flush(self, end_index: int) -> None:
+        if self._pending is None:
+            return
+        x, y, patch, transparent = self._pending
+        self._pending = None
+        # Round frame boundaries, not durations, so the error never accumulates.
+        delay = round(end_index * 100 / self.fps) - round(self._pending_start * 100 / self.fps)
+        height, width = patch.shape
+        packed = (1 << 2) | int(transparent)  # disposal 1: keep, draw next frame on top
+        self._file.write(b"!\xf9\x04" + struct.pack("<BHBB", packed, min(delay, 0xFFFF), TRANSPARENT, 0))
+        self._file.write(b"," + struct.pack("<4HB", x, y, width, height, 0))
+        self._file.write(b"\x08")
+        data = lzw_encode(patch.tobytes())
+        for start in range(0, len(data), 255):
+            block = data[start : start + 255]
+            self._file.write(bytes([len(block)]) + block)
+        self._file.write(b"\x00")
+        self.stats.frames_written += 1
+        self.stats.pixels_encoded += patch.size
+
+    def _write_header(self, palette: np.ndarray, loop: int) -> None:
+        table = np.zeros((256, 3), dtype=np.uint8)
+        table[: len(palette)] = palette
+        self._file.write(b"GIF89a" + struct.pack("<2H3B", self.width, self.height, 0xF7, 0, 0))
+        self._file.write(table.tobytes())
+        self._file.write(b"!\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+
+
+def encode_gif(
+    frames: list[np.ndarray], path: Path | str, fps: float, colors: int = MAX_COLORS, sample_every: int = 4
+) -> GifStats:
+    """Encode in-memory RGB(A) frames; the palette comes from every ``sample_every``-th frame."""
+    histogram = ColorHistogram()
+    for frame in frames[::sample_every] or frames[-1:]:
+        histogram.add(frame)
+    height, width = frames[0].shape[:2]
+    with GifWriter(path, (width, height), histogram.palette(colors), fps) as gif:
+        for frame in frames:
+            gif.write(frame)
+    return gif.stats
+
+
+def movie_frames(path: Path | str, fps: float, height: int | None = None) -> Iterator[np.ndarray]:
+    """Decode a movie with pyav, dropping frames down to ``fps`` and scaling to ``height``."""
+    import av
+
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        if height is None or height >= stream.height:
+            width, height = stream.width, stream.height
+        else:
+            width = round(stream.width * height / stream.height) // 2 * 2
+        emitted = 0
+        for frame in container.decode(stream):
+            if frame.time is not None and frame.time + 1e-6 < emitted / fps:
+                continue
+            emitted += 1
+            yield frame.reformat(width=width, height=height, format="rgb24", interpolation="AREA").to_ndarray()
+
+
+def movie_to_gif(
+    movie: Path | str,
+    gif: Path | str | None = None,
+    fps: float = 15,
+    height: int | None = 480,
+    colors: int = MAX_COLORS,
+    sample_every: int = 8,
+) -> GifStats:
+    """Convert a rendered movie in two streaming passes: palette, then frames."""
+    gif = Path(gif) if gif else Path(movie).with_suffix(".gif")
+    histogram = ColorHistogram()
+    size = None
+    for i, frame in enumerate(movie_frames(movie, fps, height)):
+        size = (frame.shape[1], frame.shape[0])
+        if i % sample_every == 0:
+            histogram.add(frame)
+    if size is None:
+        raise ValueError(f"{movie} has no video frames")
+
+    with GifWriter(gif, size, histogram.palette(colors), fps) as writer:
+        for frame in movie_frames(movie, fps, height):
+            writer.write(frame)
+    return writer.stats
+
+
+def main(argv: Iterable[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert a rendered movie into a small, palette-optimized GIF.")
+    parser.add_argument("movie", type=Path)
+    parser.add_argument("-o", "--output", type=Path, default=None, help="default: movie path with .gif")
+    parser.add_argument("--fps", type=float, default=15)
+    parser.add_argument("--height", type=int, default=480, help="0 keeps the movie's height")
+    parser.add_argument("--colors", type=int, default=MAX_COLORS)
+    args = parser.parse_args(argv)
+
+    stats = movie_to_gif(args.movie, args.output, args.fps, args.height or None, args.colors)
+    output = args.output or args.movie.with_suffix(".gif")
+    print(
+        f"{output}: {stats.bytes_written / 1024:.0f} KiB, {stats.frames_written}/{stats.frames_in} frames stored, "
+        f"{stats.pixels_encoded / max(stats.pixels_total, 1):.1%} of pixels encoded, {stats.seconds:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
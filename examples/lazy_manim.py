@@ -0,0 +1,314 @@
+"""
+Lazy-loading entry point for manim, plus an import-time report.
+
+`from manim import *` imports the whole library (every mobject, animation,
+camera and renderer module) before any scene code runs. This module exposes
+the same names, but only imports the submodule that defines a name the first
+time it is used:
+
+    from lazy_manim import Scene, Circle, Create, BLUE
+
+It works by installing a thin `manim` package object whose attributes resolve
+on demand, so the library's own `from manim import config` lines keep working.
+The name -> submodule index is read from manim's source (no imports) and
+cached per manim version.
+
+Scene files must import names explicitly (`flowchart.py` and `quicksort.py`
+do): `from manim import *` resolves every name in `__all__` and so still
+imports the whole library.
+
+Because the `manim` CLI imports the full library before loading a scene file,
+use the `render` command below to get the faster startup, and `compare` to
+measure it:
+
+    python lazy_manim.py render flowchart.py SimpleFlow -q l
+    python lazy_manim.py report quicksort.py QuickSortBars
+    python lazy_manim.py compare flowchart.py SimpleFlow
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path(os.environ.get("MANIM_LAZY_CACHE", Path.home() / ".cache" / "manim-lazy"))
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+# Names `manim/__init__.py` defines without a star import.
+_EXTRA = {"np": ["numpy", None]}
+
+
+def build_index(package_dir: Path) -> dict[str, list[str | None]]:
+    """Map every name `from manim import *` exports to ``[module, attribute]``.
+
+    ``attribute`` is None when the name is a module itself. Parsed from the
+    source with ``ast``, so nothing is imported.
+    """
+    index: dict[str, list[str | None]] = dict(_EXTRA)
+    init = package_dir / "__init__.py"
+    for node in ast.parse(init.read_text(encoding="utf-8")).body:
+        if not isinstance(node, ast.ImportFrom) or node.level != 1:
+            continue
+        module = _resolve("manim", node.module, node.level)
+        if node.module == "plugins":
+            continue  # plugin names are discovered at runtime
+        if node.names[0].name == "*":
+            for name in _star_names(package_dir, module, set()):
+                index.setdefault(name, [module, name])
+        else:
+            for alias in node.names:
+                target = f"{module}.{alias.name}"
+                is_module = _module_file(package_dir, target) is not None
+                index[alias.asname or alias.name] = [target, None] if is_module else [module, alias.name]
+    return index
+
+
+def _resolve(package: str, module: str | None, level: int) -> str:
+    base = package.rsplit(".", level - 1)[0] if level > 1 else package
+    return f"{base}.{module}" if module else base
+
+
+def _module_file(package_dir: Path, module: str) -> Path | None:
+    rel = Path(*module.split(".")[1:])
+    for candidate in (package_dir / rel / "__init__.py", (package_dir / rel).with_suffix(".py")):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _star_names(package_dir: Path, module: str, seen: set[str]) -> list[str]:
+    """Names a star import of ``module`` would bind, following nested star imports."""
+    path = _module_file(package_dir, module)
+    if path is None or module in seen:
+        return []
+    seen.add(module)
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    package = module if path.name == "__init__.py" else module.rsplit(".", 1)[0]
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets
+        ):
+            try:
+                return [str(name) for name in ast.literal_eval(node.value)]
+            except ValueError:
+                break
+
+    names: list[str] = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names.extend(t.id for t in node.targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.append(node.target.id)
+        elif isinstance(node, ast.Import):
+            names.extend((a.asname or a.name).split(".")[0] for a in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.names[0].name == "*" and node.level:
+                names.extend(_star_names(package_dir, _resolve(package, node.module, node.level), seen))
+            elif node.module != "__future__":
+                names.extend(a.asname or a.name for a in node.names)
+    return [name for name in names if not name.startswith("_")]
+
+
+def load_index() -> dict[str, list[str | None]]:
+    spec = importlib.util.find_spec("manim")
+    if spec is None or spec.origin is None:
+        raise ImportError("manim is not installed")
+    version = importlib.metadata.version("manim")
+    cache = CACHE_DIR / f"index-{version}.json"
+    if cache.exists():
+        return json.loads(cache.read_text(encoding="utf-8"))
+
+    index = build_index(Path(spec.origin).parent)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache.write_text(json.dumps(index, sort_keys=True), encoding="utf-8")
+    return index
+
+
+def install() -> types.ModuleType:
+    """Put a lazily populated `manim` package in ``sys.modules`` and return it."""
+    existing = sys.modules.get("manim")
+    if existing is not None:
+        return existing  # already imported (e.g. by the manim CLI)
+
+    spec = importlib.util.find_spec("manim")
+    index = load_index()
+    package = types.ModuleType("manim")
+    package.__file__ = spec.origin
+    package.__path__ = list(spec.submodule_search_locations)
+    package.__package__ = "manim"
+    package.__spec__ = spec
+    package.__version__ = importlib.metadata.version("manim")
+    package.__all__ = sorted(index)  # `from manim import *` still gets everything
+
+    def __getattr__(name: str) -> Any:
+        if name not in index:
+            raise AttributeError(f"module 'manim' has no attribute {name!r}")
+        module_name, attr = index[name]
+        module = importlib.import_module(module_name)
+        value = module if attr is None else getattr(module, attr)
+        setattr(package, name, value)
+        return value
+
+    package.__getattr__ = __getattr__
+    package.__dir__ = lambda: sorted(set(index) | set(vars(package)))
+    sys.modules["manim"] = package
+    # Config has to exist before any other manim module initializes.
+    importlib.import_module("manim._config")
+    return package
+
+
+_manim = install()
+
+
+def __getattr__(name: str) -> Any:
+    value = getattr(_manim, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return dir(_manim)
+
+
+def load_scene(path: Path | str, scene_name: str) -> type:
+    """Import a scene file by path and return the named Scene subclass."""
+    path = Path(path).absolute()
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def render(path: Path | str, scene_name: str, quality: str = "l", dry_run: bool = False, **options: Any) -> Any:
+    """Render one scene; ``options`` are extra config overrides (e.g. ``format="gif"``)."""
+    config = _manim.config
+    with _manim.tempconfig({"quality": QUALITIES[quality], "dry_run": dry_run, **options}):
+        config.input_file = Path(path).absolute()
+        scene = load_scene(path, scene_name)()
+        scene.render()
+    return scene
+
+
+def import_report(path: Path | str, scene_name: str, render_scene: bool = False, top: int = 15) -> str:
+    """Run the scene in a fresh interpreter with ``-X importtime`` and summarize it."""
+    here = Path(__file__).absolute().parent
+    action = "render(p, s, dry_run=True)" if render_scene else "load_scene(p, s)"
+    code = (
+        f"import sys; sys.path.insert(0, {str(here)!r}); "
+        f"from lazy_manim import load_scene, render; p, s = {str(path)!r}, {scene_name!r}; {action}"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "scene failed")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = (part.strip() for part in line[len("import time:") :].split("|"))
+        rows.append((module, int(self_us), int(cumulative_us)))
+
+    by_package: dict[str, int] = {}
+    for module, self_us, _ in rows:
+        parts = module.split(".")
+        key = ".".join(parts[:2]) if parts[0] == "manim" else parts[0]
+        by_package[key] = by_package.get(key, 0) + self_us
+
+    total = sum(self_us for _, self_us, _ in rows)
+    manim_modules = sum(1 for module, _, _ in rows if module.startswith("manim"))
+    lines = [
+        f"{scene_name}: {len(rows)} modules ({manim_modules} from manim), {total / 1000:.1f} ms total import time",
+        "",
+        f"{'package':<32}{'self ms':>10}",
+    ]
+    for key, self_us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+        lines.append(f"{key:<32}{self_us / 1000:>10.1f}")
+    return "\n".join(lines)
+
+
+def import_comparison(path: Path | str, scene_name: str, repeats: int = 5) -> str:
+    """Time loading the scene after a full ``import manim`` vs. through the lazy package.
+
+    Each run is a fresh interpreter; the best of ``repeats`` wall times is
+    reported, with the number of manim modules each way ended up importing.
+    """
+    here = Path(__file__).absolute().parent
+    setup = f"import sys; sys.path.insert(0, {str(here)!r}); "
+    load = (
+        f"from lazy_manim import load_scene; load_scene({str(path)!r}, {scene_name!r}); "
+        "print(sum(m == 'manim' or m.startswith('manim.') for m in sys.modules))"
+    )
+    variants = {"eager (import manim)": setup + "import manim; " + load, "lazy": setup + load}
+
+    lines = [f"{scene_name}: best of {repeats} fresh interpreters", "", f"{'':<24}{'seconds':>10}{'modules':>10}"]
+    for label, code in variants.items():
+        best, modules = float("inf"), 0
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=False)
+            elapsed = time.perf_counter() - start
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "scene failed")
+            best, modules = min(best, elapsed), int(result.stdout.split()[-1])
+        lines.append(f"{label:<24}{best:>10.3f}{modules:>10}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    render_cmd = sub.add_parser("render", help="render a scene without the eager manim CLI import")
+    render_cmd.add_argument("file")
+    render_cmd.add_argument("scene")
+    render_cmd.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    render_cmd.add_argument("--dry-run", action="store_true")
+
+    report_cmd = sub.add_parser("report", help="show what a scene imports and how long it takes")
+    report_cmd.add_argument("file")
+    report_cmd.add_argument("scene")
+    report_cmd.add_argument("--render", action="store_true", help="include a dry-run render")
+    report_cmd.add_argument("--top", type=int, default=15)
+
+    compare_cmd = sub.add_parser("compare", help="time loading a scene eagerly vs. lazily")
+    compare_cmd.add_argument("file")
+    compare_cmd.add_argument("scene")
+    compare_cmd.add_argument("-n", "--repeats", type=int, default=5)
+
+    args = parser.parse_args(argv)
+    if args.command == "render":
+        render(args.file, args.scene, args.quality, args.dry_run)
+    elif args.command == "compare":
+        print(import_comparison(Path(args.file).absolute(), args.scene, args.repeats))
+    else:
+        print(import_report(args.file, args.scene, args.render, args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Mobject pooling for event-driven scenes.
+
+QuickSortBars builds a complete set of target mobjects for every event: bars,
+value and index labels, the range box and the pivot marker. `Transform` only
+copies their shape into the on-screen mobjects, so after each play the
+targets are garbage, and a long render spends much of its time allocating
+them and collecting them again.
+
+`MobjectPool` hands out recycled instances keyed by type and shape. Builders
+acquire an instance, then reset whatever varies (position, color). Before
+building the next event, `recycle` returns every acquired mobject that is
+not on screen to the pool. Memory stays bounded by the pool size instead of
+growing with the number of events.
+
+Run with: manim -pql mobject_pool.py PooledQuickSortBars
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable
+
+from manim import *
+
+from quicksort import Event, QuickSortBars
+
+
+@dataclass
+class PoolStats:
+    created: int = 0
+    reused: int = 0
+    released: int = 0
+    dropped: int = 0  # released while the idle list for that key was full
+
+    @property
+    def hit_rate(self) -> float:
+        acquired = self.created + self.reused
+        return self.reused / acquired if acquired else 0.0
+
+
+class MobjectPool:
+    """
+    Recycles mobjects of the same type and shape.
+
+    Usage:
+        pool = MobjectPool()
+        label = pool.acquire(("label", "7"), lambda: Text("7"))
+        label.next_to(bar, UP)          # reset what varies
+        ...
+        pool.recycle(keep=scene.mobjects)  # after the play that used it
+
+    Pool only mobjects used as animation targets or that stay on screen: a
+    mobject removed from the scene after being transformed would come back
+    under a key that no longer matches its shape.
+    """
+
+    def __init__(self, max_idle_per_key: int = 64):
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: dict[Hashable, list[Mobject]] = defaultdict(list)
+        self._out: dict[int, tuple[Hashable, Mobject]] = {}
+        self._stats: dict[str, PoolStats] = defaultdict(PoolStats)
+
+    def acquire(self, key: Hashable, factory: Callable[[], Mobject]) -> Mobject:
+        """Return an idle mobject for ``key``, or build one with ``factory``."""
+        kind = self._kind(key)
+        idle = self._idle.get(key)
+        if idle:
+            mob = idle.pop()
+            self._stats[kind].reused += 1
+        else:
+            mob = factory()
+            self._stats[kind].created += 1
+        self._out[id(mob)] = (key, mob)
+        return mob
+
+    def release(self, *mobjects: Mobject) -> None:
+        for mob in mobjects:
+            entry = self._out.pop(id(mob), None)
+            if entry is None:
+                continue
+            key = entry[0]
+            stats = self._stats[self._kind(key)]
+            stats.released += 1
+            idle = self._idle[key]
+            if len(idle) < self.max_idle_per_key:
+                idle.append(mob)
+            else:
+                stats.dropped += 1
+
+    def recycle(self, keep: Iterable[Mobject] = ()) -> int:
+        """Release every acquired mobject outside the families of ``keep``; return the count."""
+        kept = {id(m) for mob in keep for m in mob.get_family()}
+        free = [mob for mob_id, (_, mob) in self._out.items() if mob_id not in kept]
+        self.release(*free)
+        return len(free)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        report = {}
+        for kind, stats in sorted(self._stats.items()):
+            report[kind] = {
+                "created": stats.created,
+                "reused": stats.reused,
+                "released": stats.released,
+                "dropped": stats.dropped,
+                "hit_rate": round(stats.hit_rate, 3),
+            }
+        report["total"] = {
+            "created": sum(s.created for s in self._stats.values()),
+            "reused": sum(s.reused for s in self._stats.values()),
+            "in_use": len(self._out),
+            "idle": sum(len(idle) for idle in self._idle.values()),
+            "keys": len(self._idle),
+        }
+        return report
+
+    @staticmethod
+    def _kind(key: Hashable) -> str:
+        return str(key[0]) if isinstance(key, tuple) and key else str(key)
+
+
+def _size_key(value: float) -> float:
+    # Shapes within 1e-4 units are indistinguishable on screen.
+    return round(value, 4)
+
+
+class PooledQuickSortBars(QuickSortBars):
+    """QuickSortBars whose event builders recycle bars, labels, range boxes and pivot markers."""
+
+    def setup(self):
+        super().setup()
+        self.pool = MobjectPool()
+
+    def tear_down(self):
+        logger.info("MobjectPool stats: %s", self.pool.stats())
+        super().tear_down()
+
+    def build_bars(self, event: Event, total: int, max_value: int) -> tuple[VGroup, VGroup, VGroup]:
+        # The previous event's targets are done once its plays have finished.
+        self.pool.recycle(keep=self.mobjects)
+
+        bars, labels, index_labels = VGroup(), VGroup(), VGroup()
+        step = self.BAR_WIDTH + self.BAR_GAP
+        center = (total - 1) / 2
+        sorted_set = set(event.sorted_indices)
+        compare_set = set(event.compare_indices)
+        swap_set = set(event.swap_indices)
+
+        for idx, value in enumerate(event.array):
+            height = 0.55 + (value / max_value) * self.MAX_BAR_HEIGHT
+            color = self.color_for_index(
+                idx, event.left, event.right, event.pivot_index, sorted_set, compare_set, swap_set
+            )
+
+            bar = self.pool.acquire(
+                ("bar", _size_key(height)),
+                lambda: RoundedRectangle(
+                    corner_radius=0.08,
+                    width=self.BAR_WIDTH,
+                    height=height,
+                    stroke_width=1.5,
+                    stroke_color=WHITE,
+                ),
+            )
+            bar.set_fill(color, opacity=0.95)
+            bar.move_to(np.array([(idx - center) * step, self.BASELINE_Y + height / 2, 0]))
+            bars.add(bar)
+
+            value_label = self._text(str(value), 22, WHITE)
+            labels.add(value_label.next_to(bar, UP, buff=0.09))
+            idx_label = self._text(str(idx), 14, GRAY_C)
+            index_labels.add(idx_label.next_to(bar, DOWN, buff=0.09))
+
+        return bars, labels, index_labels
+
+    def build_active_range_box(self, event: Event, bars: VGroup) -> VMobject:
+        def build() -> VMobject:
+            return super(PooledQuickSortBars, self).build_active_range_box(event, bars)
+
+        if not (0 <= event.left <= event.right < len(bars)):
+            return self.pool.acquire(("range_box", None), build)
+
+        subset = VGroup(*bars[event.left : event.right + 1])
+        box = self.pool.acquire(("range_box", _size_key(subset.width), _size_key(subset.height)), build)
+        return box.move_to(subset)
+
+    def build_pivot_marker(self, event: Event, bars: VGroup) -> VGroup:
+        def build() -> VGroup:
+            return super(PooledQuickSortBars, self).build_pivot_marker(event, bars)
+
+        if event.pivot_index is None or not 0 <= event.pivot_index < len(bars):
+            # The hidden marker never moves, so one instance serves every event.
+            return self.pool.acquire(("pivot_marker", False), build)
+
+        marker = self.pool.acquire(("pivot_marker", True), build)
+        # The arrow has the same length every time, so moving it is enough.
+        start = bars[event.pivot_index].get_top() + UP * 0.65
+        return marker.shift(start - marker[0].get_start())
+
+    def _text(self, text: str, font_size: float, color: ParsableManimColor) -> Text:
+        key = ("text", text, font_size, str(color))
+        return self.pool.acquire(key, lambda: Text(text, font_size=font_size, color=color))
@@ -0,0 +1,233 @@
+"""
+Single-pass multi-target export: one rasterization, several outputs.
+
+Rendering a 4K master, a 1080p MP4, a WebM and a blog GIF normally means four
+full renders. `MultiTargetScene` taps every frame manim rasterizes for the
+master movie and feeds it to extra encoders on a background thread. Each
+target downscales with FFmpeg's scaler (via pyav) and keeps only the frames
+its own frame rate needs.
+
+Run with (targets are written next to the master movie):
+  manim -qk --disable_caching multi_export.py QuickSortMultiExport
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+
+import av
+import numpy as np
+from manim import *
+
+from quicksort import QuickSortBars
+
+
+@dataclass(frozen=True)
+class ExportTarget:
+    name: str
+    height: int
+    fps: int
+    extension: str = ".mp4"
+    codec: str = "libx264"
+    pix_fmt: str = "yuv420p"
+    options: tuple[tuple[str, str], ...] = (("crf", "23"),)
+
+    @property
+    def is_gif(self) -> bool:
+        return self.extension == ".gif"
+
+
+MP4_1080P = ExportTarget("1080p", height=1080, fps=60)
+WEBM_720P = ExportTarget(
+    "720p", height=720, fps=30, extension=".webm", codec="libvpx-vp9", options=(("crf", "32"), ("b", "0"))
+)
+GIF_480P = ExportTarget("blog", height=480, fps=15, extension=".gif", codec="gif", pix_fmt="pal8", options=())
+
+
+class TargetEncoder:
+    """Downscale, decimate and encode master frames for one target."""
+
+    def __init__(self, target: ExportTarget, path: Path, master_size: tuple[int, int], master_fps: float):
+        master_w, master_h = master_size
+        self.target = target
+        self.path = path
+        self.height = min(target.height, master_h) // 2 * 2  # even sizes for yuv420p
+        self.width = round(master_w * self.height / master_h) // 2 * 2
+        self.fps = min(target.fps, master_fps)
+        self.step = self.fps / master_fps
+        self.master_frames = 0
+        self.frames_written = 0
+
+        self.container = av.open(str(path), mode="w")
+        self.stream = self.container.add_stream(
+            target.codec, rate=Fraction(self.fps).limit_denominator(1001), options=dict(target.options)
+        )
+        self.stream.width = self.width
+        self.stream.height = self.height
+        self.stream.pix_fmt = target.pix_fmt
+        self.graph = self._palette_graph() if target.is_gif else None
+
+    def push(self, frame: np.ndarray, num_frames: int = 1) -> None:
+        scaled = None
+        for _ in range(num_frames):
+            self.master_frames += 1
+            # Emit whenever this target's clock passes its next frame.
+            if self.master_frames * self.step < self.frames_written + 1 - 1e-9:
+                continue
+            if scaled is None:
+                scaled = self._scale(frame)
+            self._encode(scaled)
+
+    def close(self) -> None:
+        if self.graph is not None:
+            self.graph.push(None)
+            self._drain_graph()
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+    def _scale(self, frame: np.ndarray) -> av.VideoFrame:
+        source = av.VideoFrame.from_ndarray(np.ascontiguousarray(frame), format="rgba")
+        pix_fmt = "rgb24" if self.graph is not None else self.target.pix_fmt
+        return source.reformat(width=self.width, height=self.height, format=pix_fmt, interpolation="AREA")
+
+    def _encode(self, frame: av.VideoFrame) -> None:
+        frame.pts = self.frames_written
+        self.frames_written += 1
+        if self.graph is not None:
+            frame.time_base = 1 / Fraction(self.fps).limit_denominator(1001)
+            self.graph.push(frame)
+            self._drain_graph()
+            return
+        for packet in self.stream.encode(frame):
+            self.container.mux(packet)
+
+    def _palette_graph(self) -> av.filter.Graph:
+        # Same palettegen/paletteuse chain manim uses for --format=gif.
+        graph = av.filter.Graph()
+        source = graph.add_buffer(
+            width=self.width,
+            height=self.height,
+            format="rgb24",
+            time_base=1 / Fraction(self.fps).limit_denominator(1001),
+        )
+        split = graph.add("split")
+        palettegen = graph.add("palettegen", "stats_mode=diff")
+        paletteuse = graph.add("paletteuse", "dither=bayer:bayer_scale=5:diff_mode=rectangle")
+        sink = graph.add("buffersink")
+        source.link_to(split)
+        split.link_to(palettegen, 0, 0)
+        split.link_to(paletteuse, 1, 0)
+        palettegen.link_to(paletteuse, 0, 1)
+        paletteuse.link_to(sink)
+        graph.configure()
+        self._gif_pts = 0
+        return graph
+
+    def _drain_graph(self) -> None:
+        while True:
+            try:
+                frame = self.graph.pull()
+            except (av.error.BlockingIOError, av.error.EOFError):
+                return
+            frame.pts = self._gif_pts
+            self._gif_pts += 1
+            for packet in self.stream.encode(frame):
+                self.container.mux(packet)
+
+
+class MultiExport:
+    """Fan master frames out to several ``TargetEncoder``s on one worker thread."""
+
+    # Frames waiting for the encoders; 4K RGBA frames are ~33 MB each.
+    QUEUE_BYTES = 256 * 1024 * 1024
+    QUEUE_MAX_FRAMES = 32
+
+    def __init__(self, targets: list[ExportTarget], movie_path: Path, master_size: tuple[int, int], master_fps: float):
+        self.encoders = [
+            TargetEncoder(t, movie_path.with_name(f"{movie_path.stem}_{t.name}{t.extension}"), master_size, master_fps)
+            for t in targets
+        ]
+        frame_bytes = master_size[0] * master_size[1] * 4
+        maxsize = max(2, min(self.QUEUE_MAX_FRAMES, self.QUEUE_BYTES // frame_bytes))
+        self.queue: Queue[tuple[np.ndarray, int] | None] = Queue(maxsize=maxsize)
+        self.error: BaseException | None = None
+        self.thread = Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def push(self, frame: np.ndarray, num_frames: int = 1) -> None:
+        self._raise_if_failed()
+        self.queue.put((frame, num_frames))
+
+    def close(self) -> list[Path]:
+        self.queue.put(None)
+        self.thread.join()
+        self._raise_if_failed()
+        for encoder in self.encoders:
+            encoder.close()
+        return [encoder.path for encoder in self.encoders]
+
+    def _run(self) -> None:
+        while (item := self.queue.get()) is not None:
+            if self.error is not None:
+                continue  # keep draining so push() never blocks on a full queue
+            frame, num_frames = item
+            try:
+                for encoder in self.encoders:
+                    encoder.push(frame, num_frames)
+            except BaseException as exc:
+                self.error = exc
+
+    def _raise_if_failed(self) -> None:
+        if self.error is not None:
+            raise RuntimeError("export target encoder failed") from self.error
+
+
+class MultiTargetScene(Scene):
+    """
+    Mixin that writes ``export_targets`` alongside the master movie.
+
+    The master uses the normal quality flags (e.g. ``-qk`` for 4K60); targets
+    never upscale. Partial-movie caching is turned off, since cached
+    animations are never rasterized and would be missing from the targets.
+    """
+
+    export_targets: list[ExportTarget] = [MP4_1080P, WEBM_720P, GIF_480P]
+
+    def setup(self):
+        super().setup()
+        self.multi_export = None
+        writer = self.renderer.file_writer
+        if config.dry_run or not config.write_to_movie or not hasattr(writer, "movie_file_path"):
+            return
+
+        config.disable_caching = True
+        self.multi_export = MultiExport(
+            self.export_targets,
+            Path(writer.movie_file_path),
+            (config.pixel_width, config.pixel_height),
+            config.frame_rate,
+        )
+        write_frame = writer.write_frame
+
+        def tapped_write_frame(frame, *args, **kwargs):
+            write_frame(frame, *args, **kwargs)
+            # ``num_frames`` up to manim 0.21, keyword-only ``repeat`` since.
+            repeat = kwargs.get("repeat", kwargs.get("num_frames", args[0] if args else 1))
+            self.multi_export.push(frame if isinstance(frame, np.ndarray) else frame.get_frame(), repeat)
+
+        writer.write_frame = tapped_write_frame
+
+    def tear_down(self):
+        if self.multi_export is not None:
+            for path in self.multi_export.close():
+                logger.info("Export target written to %(path)s", {"path": f"'{path}'"})
+        super().tear_down()
+
+
+class QuickSortMultiExport(MultiTargetScene, QuickSortBars):
+    """QuickSortBars rendered once: 4K master + 1080p MP4 + 720p WebM + GIF."""
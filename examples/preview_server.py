@@ -0,0 +1,474 @@
+"""
+Event-scrubbing preview server for QuickSortBars.
+
+Tweaking pacing or styling normally means re-rendering and re-watching the
+whole video. This server indexes the `Event` list, rasterizes any single
+event on demand (static layers are drawn once and reused as the camera
+background), keeps recent frames in an LRU cache and precomputes keyframes
+in the background. A browser page scrubs through events with the arrow keys.
+
+Keys: Left/Right one event, Shift+Left/Right 10, PageUp/PageDown 100,
+Home/End, and c / s / p to jump to the next compare / swap / pivot_fixed
+event (Shift for the previous one).
+
+Run with:
+    python preview_server.py                      # the 14-value QuickSortBars input
+    python preview_server.py --n 620              # ~10k events, compact bars
+    python preview_server.py --n 620 --bench 200  # measure seek latency, no server
+Then open http://127.0.0.1:8765 (the server only listens on localhost).
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import io
+import json
+import random
+import re
+import statistics
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Hashable, Sequence
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+from manim import *
+from PIL import Image
+
+from mobject_pool import MobjectPool, PooledQuickSortBars
+from quicksort import Event
+
+DEFAULT_DATA = [14, 3, 9, 1, 11, 7, 2, 13, 5, 10, 6, 12, 4, 8]  # as in QuickSortBars.construct
+INTRO_SECONDS = 1.0 + 2.2  # title and setup plays before the first event
+LABELLED_MAX = 40  # above this many bars, labels are unreadable: use compact bars
+
+
+@dataclass
+class EventIndex:
+    events: Sequence[Event]
+    starts: list[float]  # scene time at which each event's plays begin
+    by_action: dict[str, list[int]]
+
+    @classmethod
+    def build(cls, events: Sequence[Event]) -> EventIndex:
+        starts, t = [], INTRO_SECONDS
+        by_action: dict[str, list[int]] = {}
+        for i, event in enumerate(events):
+            starts.append(t)
+            by_action.setdefault(event.action, []).append(i)
+            if i:  # events[0] is shown by the setup play
+                t += event_seconds(event)
+        return cls(events, starts, by_action)
+
+    def find(self, action: str, start: int, direction: int = 1) -> int | None:
+        """Nearest event with ``action`` strictly after (or before) ``start``."""
+        positions = self.by_action.get(action, [])
+        if direction > 0:
+            i = bisect.bisect_right(positions, start)
+            return positions[i] if i < len(positions) else None
+        i = bisect.bisect_left(positions, start) - 1
+        return positions[i] if i >= 0 else None
+
+    def info(self, k: int) -> dict:
+        event = self.events[k]
+        return {
+            "index": k,
+            "step": event.step,
+            "action": event.action,
+            "message": event.message,
+            "depth": event.depth,
+            "range": [event.left, event.right],
+            "comparisons": event.comparisons,
+            "swaps": event.swaps,
+            "time": round(self.starts[k], 3),
+        }
+
+
+def event_seconds(event: Event) -> float:
+    """Scene time one event takes in QuickSortBars.construct, extra highlight plays included."""
+    seconds = PooledQuickSortBars.duration_for(event.action)
+    if event.compare_indices:
+        seconds += 0.18
+    if len(event.swap_indices) == 2:
+        seconds += 0.25
+    if event.action == "pivot_fixed" and event.pivot_index is not None:
+        seconds += 0.26
+    return seconds
+
+
+class _PreviewScene(PooledQuickSortBars):
+    """QuickSortBars builders, with message and stats text reused across events."""
+
+    TEXT_CACHE_SIZE = 4096
+
+    def build_message(self, event: Event) -> Text:
+        return self._cached(event.message, lambda: super(_PreviewScene, self).build_message(event))
+
+    def build_stats_text(self, event: Event, panel: Mobject | None = None) -> VGroup:
+        key = ("stats", event.step, event.depth, event.left, event.right, event.comparisons, event.swaps)
+        return self._cached(key, lambda: super(_PreviewScene, self).build_stats_text(event, self.stats_panel))
+
+    def _cached(self, key: Hashable, build: Callable[[], Mobject]) -> Mobject:
+        cache = self.__dict__.setdefault("_text_cache", OrderedDict())
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        mob = cache[key] = build()
+        if len(cache) > self.TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return mob
+
+
+class FrameRenderer:
+    """Rasterizes single events on a private camera over a cached static layer."""
+
+    def __init__(self, data: list[int], events: Sequence[Event], pixel_width: int = 854, pixel_height: int = 480):
+        self.data = data
+        self.events = events
+        self.max_value = max(data)
+        self.compact = len(data) > LABELLED_MAX
+        self.lock = threading.Lock()  # cairo contexts and pooled mobjects are not thread-safe
+
+        # Builders only need the class attributes and a pool, not a renderer.
+        self.scene = object.__new__(_PreviewScene)
+        self.scene.pool = MobjectPool()
+        self.scene.mobjects = []
+        self.scene.stats_panel = self.scene.build_stats_panel()
+
+        self.camera = Camera(pixel_width=pixel_width, pixel_height=pixel_height)
+        self.camera.capture_mobjects(self._static_layer())
+        self.camera.set_background(self.camera.pixel_array.copy())
+
+    def render(self, k: int) -> np.ndarray:
+        event = self.events[k]
+        with self.lock:
+            mobjects = self._event_layer(event)
+            self.camera.reset()
+            self.camera.capture_mobjects(mobjects)
+            return self.camera.pixel_array.copy()
+
+    def _static_layer(self) -> list[Mobject]:
+        scene = self.scene
+        legend = scene.build_legend().to_corner(UR, buff=0.28)
+        return [*scene.build_background(), *scene.build_title(), scene.build_baseline(), legend, scene.stats_panel]
+
+    def _event_layer(self, event: Event) -> list[Mobject]:
+        total = len(self.data)
+        if self.compact:
+            bars = self.scene.build_compact_bars(event, total, self.max_value)
+            markers = self._compact_markers(event)
+            layer = [*markers, bars]
+        else:
+            bars, labels, index_labels = self.scene.build_bars(event, total, self.max_value)
+            range_box = self.scene.build_active_range_box(event, bars)
+            pivot = self.scene.build_pivot_marker(event, bars)
+            layer = [range_box, bars, labels, index_labels, pivot]
+
+        return [*layer, self.scene.build_message(event), self.scene.build_stats_text(event)]
+
+    def _compact_markers(self, event: Event) -> list[Mobject]:
+        step = 12.8 / len(self.data)
+        baseline = self.scene.BASELINE_Y
+
+        def bar_height(value: int) -> float:
+            return 0.55 + value / self.max_value * self.scene.MAX_BAR_HEIGHT
+
+        markers: list[Mobject] = []
+        if 0 <= event.left <= event.right < len(self.data):
+            height = bar_height(max(event.array[event.left : event.right + 1])) + 0.12
+            box = Rectangle(width=step * (event.right - event.left + 1), height=height)
+            box.set_fill(color=BLUE_E, opacity=0.12).set_stroke(color=BLUE_B, width=1.5, opacity=0.85)
+            box.move_to(np.array([-6.4 + step * (event.left + event.right + 1) / 2, baseline + height / 2, 0]))
+            markers.append(box)
+        if event.pivot_index is not None:
+            x = -6.4 + step * (event.pivot_index + 0.5)
+            top = np.array([x, baseline + bar_height(event.array[event.pivot_index]), 0])
+            tip = Triangle(color=YELLOW_B, fill_opacity=1, stroke_width=0).rotate(PI).scale(0.08)
+            markers.append(tip.next_to(top, UP, buff=0.04))
+        return markers
+
+
+class FrameCache:
+    """Thread-safe LRU cache of encoded frames."""
+
+    def __init__(self, max_items: int = 512):
+        self.max_items = max_items
+        self._items: OrderedDict[int, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, k: int) -> bytes | None:
+        with self._lock:
+            data = self._items.get(k)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(k)
+            self.hits += 1
+            return data
+
+    def put(self, k: int, data: bytes) -> None:
+        with self._lock:
+            self._items[k] = data
+            self._items.move_to_end(k)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    # Level 1: a few ms instead of tens, and localhost bandwidth is free.
+    Image.fromarray(pixels[..., :3]).save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+class Preview:
+    """Frames for the server: LRU cache, then keyframes, then an on-demand render."""
+
+    def __init__(self, index: EventIndex, renderer: FrameRenderer, keyframe_every: int, cache_size: int = 512):
+        self.index = index
+        self.renderer = renderer
+        self.keyframe_every = max(1, keyframe_every)
+        self.cache = FrameCache(cache_size)
+        self.keyframes: dict[int, bytes] = {}
+        self.render_ms: list[float] = []
+
+    def frame(self, k: int) -> tuple[bytes, str]:
+        cached = self.keyframes.get(k) or self.cache.get(k)
+        if cached is not None:
+            return cached, "cache"
+        start = time.perf_counter()
+        data = encode_png(self.renderer.render(k))
+        self.render_ms.append((time.perf_counter() - start) * 1000)
+        self.cache.put(k, data)
+        return data, "render"
+
+    def keyframe(self, k: int) -> bytes | None:
+        """Closest precomputed keyframe at or before ``k``."""
+        for key in range(k - k % self.keyframe_every, -1, -self.keyframe_every):
+            if key in self.keyframes:
+                return self.keyframes[key]
+        return None
+
+    def precompute_keyframes(self) -> threading.Thread:
+        def work() -> None:
+            for k in range(0, len(self.index.events), self.keyframe_every):
+                self.keyframes[k] = encode_png(self.renderer.render(k))
+
+        thread = threading.Thread(target=work, daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> dict:
+        times = sorted(self.render_ms)
+        return {
+            "events": len(self.index.events),
+            "keyframes": len(self.keyframes),
+            "cached": len(self.cache),
+            "hits": self.cache.hits,
+            "misses": self.cache.misses,
+            "render_ms_p50": round(times[len(times) // 2], 1) if times else None,
+            "render_ms_p95": round(times[int(len(times) * 0.95)], 1) if times else None,
+        }
+
+
+def make_handler(preview: Preview) -> type[BaseHTTPRequestHandler]:
+    routes = [
+        (re.compile(r"^/frame/(\d+)\.png$"), "frame"),
+        (re.compile(r"^/keyframe/(\d+)\.png$"), "keyframe"),
+        (re.compile(r"^/event/(\d+)\.json$"), "event"),
+    ]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            if url.path == "/":
+                return self._send(PAGE.encode(), "text/html; charset=utf-8")
+            if url.path == "/index.json":
+                info = {
+                    "count": len(preview.index.events),
+                    "actions": {a: len(p) for a, p in preview.index.by_action.items()},
+                    "duration": round(preview.index.starts[-1], 2),
+                }
+                return self._json(info)
+            if url.path == "/stats.json":
+                return self._json(preview.stats())
+            if url.path == "/find":
+                query = parse_qs(url.query)
+                found = preview.index.find(
+                    query.get("action", [""])[0], int(query.get("from", ["0"])[0]), int(query.get("dir", ["1"])[0])
+                )
+                return self._json({"index": found})
+
+            for pattern, kind in routes:
+                match = pattern.match(url.path)
+                if match is None:
+                    continue
+                k = int(match.group(1))
+                if not 0 <= k < len(preview.index.events):
+                    return self.send_error(HTTPStatus.NOT_FOUND)
+                if kind == "event":
+                    return self._json(preview.index.info(k))
+                if kind == "keyframe":
+                    data = preview.keyframe(k)
+                    if data is None:
+                        self.send_response(HTTPStatus.NO_CONTENT)
+                        return self.end_headers()
+                    return self._send(data, "image/png")
+                start = time.perf_counter()
+                data, source = preview.frame(k)
+                headers = {"X-Source": source, "X-Seek-Ms": f"{(time.perf_counter() - start) * 1000:.1f}"}
+                return self._send(data, "image/png", headers)
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+        def _json(self, payload: dict) -> None:
+            self._send(json.dumps(payload).encode(), "application/json")
+
+        def _send(self, body: bytes, content_type: str, headers: dict[str, str] | None = None) -> None:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass  # one line per frame would flood the terminal while scrubbing
+
+    return Handler
+
+
+PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>QuickSortBars preview</title>
+<style>
+  body { background: #0b0f19; color: #cbd5e1; font: 14px system-ui, sans-serif; margin: 16px; }
+  img { width: 100%; max-width: 1280px; display: block; background: #05070f; }
+  input[type=range] { width: 100%; max-width: 1280px; }
+  #info { font-family: ui-monospace, monospace; white-space: pre; margin-top: 6px; }
+</style></head>
+<body>
+<img id="frame" alt="frame">
+<input id="slider" type="range" min="0" value="0">
+<div id="info"></div>
+<script>
+let count = 0, current = 0, shown = -1, busy = false;
+const img = document.getElementById("frame");
+const slider = document.getElementById("slider");
+const info = document.getElementById("info");
+
+async function load() {
+  // One request in flight; while scrubbing, skip straight to the latest position.
+  if (busy || shown === current) return;
+  busy = true;
+  const k = current;
+  const slow = setTimeout(() => { img.src = `/keyframe/${k}.png`; }, 60);
+  const [frame, meta] = await Promise.all([fetch(`/frame/${k}.png`), fetch(`/event/${k}.json`)]);
+  clearTimeout(slow);
+  const e = await meta.json();
+  img.src = URL.createObjectURL(await frame.blob());
+  shown = k;
+  info.textContent = `event ${k + 1}/${count}  t=${e.time}s  [${e.action}]  ${e.message}\\n` +
+    `depth ${e.depth}  range [${e.range}]  comparisons ${e.comparisons}  swaps ${e.swaps}  ` +
+    `(${frame.headers.get("X-Source")}, ${frame.headers.get("X-Seek-Ms")} ms)`;
+  busy = false;
+  load();
+}
+
+function seek(k) {
+  current = Math.max(0, Math.min(count - 1, k));
+  slider.value = current;
+  load();
+}
+
+async function jump(action, dir) {
+  const r = await (await fetch(`/find?action=${action}&from=${current}&dir=${dir}`)).json();
+  if (r.index !== null) seek(r.index);
+}
+
+document.addEventListener("keydown", (ev) => {
+  const step = ev.shiftKey ? 10 : 1, dir = ev.shiftKey ? -1 : 1;
+  const keys = {
+    ArrowRight: () => seek(current + step), ArrowLeft: () => seek(current - step),
+    PageDown: () => seek(current + 100), PageUp: () => seek(current - 100),
+    Home: () => seek(0), End: () => seek(count - 1),
+    c: () => jump("compare", dir), C: () => jump("compare", dir),
+    s: () => jump("swap", dir), S: () => jump("swap", dir),
+    p: () => jump("pivot_fixed", dir), P: () => jump("pivot_fixed", dir),
+  };
+  if (keys[ev.key]) { ev.preventDefault(); keys[ev.key](); }
+});
+slider.addEventListener("input", () => seek(parseInt(slider.value)));
+
+fetch("/index.json").then(r => r.json()).then(idx => { count = idx.count; slider.max = count - 1; seek(0); });
+</script>
+</body></html>
+"""
+
+
+def build_preview(data: list[int], keyframe_every: int | None = None, cache_size: int = 512) -> Preview:
+    events = PooledQuickSortBars.build_events(object.__new__(PooledQuickSortBars), data)
+    index = EventIndex.build(events)
+    keyframe_every = keyframe_every or max(1, len(events) // 200)
+    return Preview(index, FrameRenderer(data, events), keyframe_every, cache_size)
+
+
+def bench(preview: Preview, seeks: int) -> None:
+    rng = random.Random(0)
+    count = len(preview.index.events)
+    latencies = []
+    for k in rng.sample(range(count), min(seeks, count)):
+        start = time.perf_counter()
+        preview.frame(k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    print(
+        f"{count} events, {len(latencies)} random seeks: "
+        f"p50 {statistics.median(latencies):.1f} ms, p95 {latencies[int(len(latencies) * 0.95)]:.1f} ms, "
+        f"max {latencies[-1]:.1f} ms"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Scrub through QuickSortBars events in a browser.")
+    parser.add_argument("--n", type=int, default=None, help="sort a shuffled 1..n instead of the default input")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--keyframe-every", type=int, default=None, help="default: ~200 keyframes in total")
+    parser.add_argument("--cache", type=int, default=512, help="frames kept in the LRU cache")
+    parser.add_argument("--bench", type=int, default=0, help="time this many random seeks and exit")
+    args = parser.parse_args(argv)
+
+    data = DEFAULT_DATA
+    if args.n:
+        data = list(range(1, args.n + 1))
+        random.Random(args.seed).shuffle(data)
+    preview = build_preview(data, args.keyframe_every, args.cache)
+
+    if args.bench:
+        bench(preview, args.bench)
+        return
+
+    preview.precompute_keyframes()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(preview))
+    print(f"{len(preview.index.events)} events; preview at http://127.0.0.1:{args.port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
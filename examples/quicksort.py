@@ -1,9 +1,62 @@
 from __future__ import annotations
 
+import copy
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import numpy as np
-from manim import *
+# Explicit names (not a star import) so lazy_manim only loads what this file uses.
+from manim import (
+    Arrow,
+    BLUE_B,
+    BLUE_C,
+    BLUE_E,
+    BOLD,
+    Circle,
+    Circumscribe,
+    config,
+    Create,
+    DOWN,
+    FadeIn,
+    FadeOut,
+    Flash,
+    GRAY_A,
+    GRAY_B,
+    GRAY_C,
+    GRAY_D,
+    GRAY_E,
+    GREEN_A,
+    GREEN_C,
+    Indicate,
+    LaggedStart,
+    LEFT,
+    Line,
+    ManimColor,
+    Mobject,
+    NumberPlane,
+    ORANGE,
+    ORIGIN,
+    ParsableManimColor,
+    PURPLE_E,
+    Rectangle,
+    RED_C,
+    RIGHT,
+    RoundedRectangle,
+    Scene,
+    Square,
+    SurroundingRectangle,
+    Text,
+    Transform,
+    UL,
+    UP,
+    UR,
+    VGroup,
+    VMobject,
+    WHITE,
+    YELLOW_A,
+    YELLOW_B,
+    YELLOW_D,
+)
 
 
 @dataclass
@@ -23,6 +76,119 @@ class Event:
     swaps: int
 
 
+class EventLog(Sequence):
+    """
+    Recorded `Event`s that share one array history.
+
+    Copying the array into every event makes memory grow with
+    events x n (quadratic for quicksort). The log stores the swaps and
+    fixed indices in order, plus a copy of the array every `len(array) // 16`
+    swaps (at least 64). Indexing rebuilds `array` and `sorted_indices` from
+    the nearest copy, so an `Event` costs O(n) on access and a few counters
+    in memory. Slices are views over the same history.
+    """
+
+    def __init__(self, source: list[int]):
+        self.current = source[:]  # the array being sorted; change it through swap()
+        self._records: list[tuple] = []
+        self._swaps: list[tuple[int, int]] = []
+        self._fixed: list[int] = []
+        self._fixed_set: set[int] = set()
+        self._every = max(64, len(source) // 16)
+        self._checkpoints = [source[:]]
+        self._indices: range | None = None  # set on slices
+        self._last_array = (0, self._checkpoints[0])
+        self._last_sorted: tuple[int, tuple[int, ...]] = (0, ())
+
+    def swap(self, i: int, j: int) -> None:
+        self.current[i], self.current[j] = self.current[j], self.current[i]
+        self._swaps.append((i, j))
+        if len(self._swaps) % self._every == 0:
+            self._checkpoints.append(self.current[:])
+
+    def fix(self, *indices: int) -> None:
+        for index in indices:
+            if index not in self._fixed_set:
+                self._fixed_set.add(index)
+                self._fixed.append(index)
+
+    def record(
+        self,
+        left: int,
+        right: int,
+        pivot_index: int | None,
+        compare_indices: tuple[int, ...],
+        swap_indices: tuple[int, ...],
+        message: str,
+        action: str,
+        depth: int,
+        comparisons: int,
+    ) -> None:
+        """Append an event for the current array and fixed indices."""
+        self._records.append(
+            (
+                len(self._swaps),
+                len(self._fixed),
+                left,
+                right,
+                pivot_index,
+                compare_indices,
+                swap_indices,
+                message,
+                action,
+                depth,
+                len(self._records) + 1,
+                comparisons,
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self._records) if self._indices is None else len(self._indices)
+
+    def __getitem__(self, index):
+        positions = range(len(self._records)) if self._indices is None else self._indices
+        if isinstance(index, slice):
+            view = copy.copy(self)
+            view._indices = positions[index]
+            return view
+        swaps, fixed, left, right, pivot, compare, swapped, message, action, depth, step, comparisons = self._records[
+            positions[index]
+        ]
+        return Event(
+            array=self._array_at(swaps),
+            left=left,
+            right=right,
+            pivot_index=pivot,
+            compare_indices=compare,
+            swap_indices=swapped,
+            sorted_indices=self._sorted_at(fixed),
+            message=message,
+            action=action,
+            depth=depth,
+            step=step,
+            comparisons=comparisons,
+            swaps=swaps,
+        )
+
+    def _array_at(self, swaps: int) -> list[int]:
+        # Replay from the last rebuilt array when it is close behind (sequential
+        # access), otherwise from the checkpoint at or before `swaps`.
+        start, arr = self._last_array
+        if not 0 <= swaps - start < self._every:
+            start = swaps - swaps % self._every
+            arr = self._checkpoints[start // self._every]
+        arr = arr[:]
+        for i, j in self._swaps[start:swaps]:
+            arr[i], arr[j] = arr[j], arr[i]
+        self._last_array = (swaps, arr)
+        return arr[:]
+
+    def _sorted_at(self, count: int) -> tuple[int, ...]:
+        if self._last_sorted[0] != count:
+            self._last_sorted = (count, tuple(sorted(self._fixed[:count])))
+        return self._last_sorted[1]
+
+
 class QuickSortBars(Scene):
     """
     Cinematic quicksort visualization (Lomuto partition).
@@ -44,34 +210,19 @@ class QuickSortBars(Scene):
 
         self.add(*self.build_background())
 
-        title = Text("Quick Sort", font_size=56, weight=BOLD, color=WHITE).to_edge(UP, buff=0.2)
-        subtitle = Text(
-            "Lomuto Partition | AI-ready Showcase",
-            font_size=24,
-            color=GRAY_A,
-        ).next_to(title, DOWN, buff=0.08)
+        title, subtitle = self.build_title()
         self.play(FadeIn(title, shift=0.15 * DOWN), FadeIn(subtitle, shift=0.15 * DOWN), run_time=1.0)
 
         bars, value_labels, index_labels = self.build_bars(events[0], len(data), max_value)
-        baseline = Line(
-            np.array([-6.4, self.BASELINE_Y, 0]),
-            np.array([6.4, self.BASELINE_Y, 0]),
-            stroke_color=GRAY_B,
-            stroke_width=2,
-        )
+        baseline = self.build_baseline()
 
-        message = Text(events[0].message, font_size=self.MESSAGE_FONT_SIZE, color=GRAY_A).to_edge(DOWN, buff=0.38)
+        message = self.build_message(events[0])
 
         legend = self.build_legend()
         legend.to_corner(UR, buff=0.28)
 
-        stats_panel = RoundedRectangle(corner_radius=0.14, width=3.9, height=1.7)
-        stats_panel.set_stroke(color=GRAY_C, width=1.5, opacity=0.8)
-        stats_panel.set_fill(color="#101827", opacity=0.84)
-        stats_panel.to_corner(UL, buff=0.28)
-        stats_text = self.build_stats_text(events[0]).move_to(stats_panel.get_center()).align_to(stats_panel, LEFT).shift(
-            RIGHT * 0.2
-        )
+        stats_panel = self.build_stats_panel()
+        stats_text = self.build_stats_text(events[0], stats_panel)
 
         active_range = self.build_active_range_box(events[0], bars)
         pivot_marker = self.build_pivot_marker(events[0], bars)
@@ -92,8 +243,8 @@ class QuickSortBars(Scene):
 
         for event in events[1:]:
             target_bars, target_labels, _ = self.build_bars(event, len(data), max_value)
-            target_message = Text(event.message, font_size=self.MESSAGE_FONT_SIZE, color=GRAY_A).to_edge(DOWN, buff=0.38)
-            target_stats = self.build_stats_text(event).move_to(stats_text).align_to(stats_panel, LEFT).shift(RIGHT * 0.2)
+            target_message = self.build_message(event)
+            target_stats = self.build_stats_text(event, stats_panel)
             target_range = self.build_active_range_box(event, target_bars)
             target_pivot = self.build_pivot_marker(event, target_bars)
 
@@ -166,13 +317,37 @@ class QuickSortBars(Scene):
         grid.scale(0.92)
         return [base, glow_1, glow_2, grid]
 
-    def build_events(self, source: list[int]) -> list[Event]:
-        arr = source[:]
-        events: list[Event] = []
-        sorted_set: set[int] = set()
-        step = 0
+    def build_title(self) -> tuple[Text, Text]:
+        title = Text("Quick Sort", font_size=56, weight=BOLD, color=WHITE).to_edge(UP, buff=0.2)
+        subtitle = Text(
+            "Lomuto Partition | AI-ready Showcase",
+            font_size=24,
+            color=GRAY_A,
+        ).next_to(title, DOWN, buff=0.08)
+        return title, subtitle
+
+    def build_baseline(self) -> Line:
+        return Line(
+            np.array([-6.4, self.BASELINE_Y, 0]),
+            np.array([6.4, self.BASELINE_Y, 0]),
+            stroke_color=GRAY_B,
+            stroke_width=2,
+        )
+
+    def build_message(self, event: Event) -> Text:
+        return Text(event.message, font_size=self.MESSAGE_FONT_SIZE, color=GRAY_A).to_edge(DOWN, buff=0.38)
+
+    def build_stats_panel(self) -> RoundedRectangle:
+        stats_panel = RoundedRectangle(corner_radius=0.14, width=3.9, height=1.7)
+        stats_panel.set_stroke(color=GRAY_C, width=1.5, opacity=0.8)
+        stats_panel.set_fill(color="#101827", opacity=0.84)
+        stats_panel.to_corner(UL, buff=0.28)
+        return stats_panel
+
+    def build_events(self, source: list[int]) -> EventLog:
+        events = EventLog(source)
+        arr = events.current
         comparisons = 0
-        swaps = 0
 
         def snapshot(
             left: int,
@@ -184,36 +359,20 @@ class QuickSortBars(Scene):
             action: str,
             depth: int,
         ) -> None:
-            nonlocal step
-            step += 1
-            events.append(
-                Event(
-                    array=arr[:],
-                    left=left,
-                    right=right,
-                    pivot_index=pivot_index,
-                    compare_indices=compare_indices,
-                    swap_indices=swap_indices,
-                    sorted_indices=tuple(sorted(sorted_set)),
-                    message=message,
-                    action=action,
-                    depth=depth,
-                    step=step,
-                    comparisons=comparisons,
-                    swaps=swaps,
-                )
+            events.record(
+                left, right, pivot_index, compare_indices, swap_indices, message, action, depth, comparisons
             )
 
         snapshot(0, len(arr) - 1, None, (), (), "Start: unsorted array", "start", 0)
 
         def quicksort(left: int, right: int, depth: int) -> None:
-            nonlocal comparisons, swaps
+            nonlocal comparisons
 
             if left > right:
                 return
 
             if left == right:
-                sorted_set.add(left)
+                events.fix(left)
                 snapshot(
                     left,
                     right,
@@ -255,8 +414,7 @@ class QuickSortBars(Scene):
                 if arr[j] <= pivot_value:
                     i += 1
                     if i != j:
-                        arr[i], arr[j] = arr[j], arr[i]
-                        swaps += 1
+                        events.swap(i, j)
                         snapshot(
                             left,
                             right,
@@ -281,8 +439,7 @@ class QuickSortBars(Scene):
 
             pivot_index = i + 1
             if pivot_index != right:
-                arr[pivot_index], arr[right] = arr[right], arr[pivot_index]
-                swaps += 1
+                events.swap(pivot_index, right)
                 snapshot(
                     left,
                     right,
@@ -294,7 +451,7 @@ class QuickSortBars(Scene):
                     depth,
                 )
 
-            sorted_set.add(pivot_index)
+            events.fix(pivot_index)
             snapshot(
                 left,
                 right,
@@ -361,6 +518,65 @@ class QuickSortBars(Scene):
 
         return bars, labels, index_labels
 
+    def build_compact_bars(
+        self,
+        event: Event,
+        total: int,
+        max_value: int,
+        width: float = 12.8,
+        scale: float = 1.0,
+        baseline_y: float | None = None,
+    ) -> VGroup:
+        """
+        Unlabelled bars, one VMobject per color with a rectangle subpath per bar.
+
+        A handful of mobjects instead of one per bar, so it stays cheap for
+        large arrays, previews and multi-panel scenes. Heights match
+        ``build_bars`` times ``scale``.
+        """
+        baseline_y = self.BASELINE_Y if baseline_y is None else baseline_y
+        step = width / total
+        sorted_set = set(event.sorted_indices)
+        compare_set = set(event.compare_indices)
+        swap_set = set(event.swap_indices)
+
+        groups: dict[str, list[int]] = {}
+        for idx in range(total):
+            color = self.color_for_index(
+                idx, event.left, event.right, event.pivot_index, sorted_set, compare_set, swap_set
+            )
+            groups.setdefault(ManimColor(color).to_hex(), []).append(idx)
+
+        values = np.asarray(event.array, dtype=float)
+        heights = scale * (0.55 + values / max_value * self.MAX_BAR_HEIGHT)
+        bars = VGroup()
+        for color, indices in groups.items():
+            idx = np.asarray(indices)
+            left = -width / 2 + step * (idx + 0.1)
+            right = left + step * 0.8
+            top = baseline_y + heights[idx]
+            bottom = np.full_like(left, baseline_y)
+            corners = np.stack(
+                [
+                    np.stack([left, bottom], axis=1),
+                    np.stack([right, bottom], axis=1),
+                    np.stack([right, top], axis=1),
+                    np.stack([left, top], axis=1),
+                    np.stack([left, bottom], axis=1),
+                ],
+                axis=1,
+            )
+            corners = np.concatenate([corners, np.zeros((*corners.shape[:2], 1))], axis=2)
+            # Straight cubic segments: anchors with handles at thirds.
+            start, end = corners[:, :-1, None, :], corners[:, 1:, None, :]
+            thirds = np.array([0, 1 / 3, 2 / 3, 1])[None, None, :, None]
+            points = (start + (end - start) * thirds).reshape(-1, 3)
+
+            mob = VMobject(fill_color=color, fill_opacity=0.95, stroke_width=0)
+            mob.set_points(points)
+            bars.add(mob)
+        return bars
+
     def build_active_range_box(self, event: Event, bars: VGroup) -> VMobject:
         if event.left <= event.right and event.left >= 0 and event.right < len(bars):
             subset = VGroup(*[bars[i] for i in range(event.left, event.right + 1)])
@@ -424,7 +640,7 @@ class QuickSortBars(Scene):
         return VGroup(panel, rows)
 
     @staticmethod
-    def build_stats_text(event: Event) -> VGroup:
+    def build_stats_text(event: Event, panel: Mobject | None = None) -> VGroup:
         lines = VGroup(
             Text(f"step: {event.step}", font_size=17, color=GRAY_A),
             Text(f"depth: {event.depth}", font_size=17, color=GRAY_A),
@@ -432,6 +648,8 @@ class QuickSortBars(Scene):
             Text(f"comparisons: {event.comparisons}", font_size=17, color=GRAY_A),
             Text(f"swaps: {event.swaps}", font_size=17, color=GRAY_A),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.06)
+        if panel is not None:
+            lines.move_to(panel.get_center()).align_to(panel, LEFT).shift(RIGHT * 0.2)
         return lines
 
     @staticmethod
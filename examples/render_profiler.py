@@ -0,0 +1,406 @@
+"""
+Per-play and per-stage render profiling.
+
+When a render is slow, the time can go to building mobjects (`build_bars`,
+`Text`), interpolating animations, hashing for the cache, Cairo
+rasterization or video encoding. `RenderProfiler` wraps those pipeline steps
+while it is active and records wall time and allocations for each step,
+grouped by `self.play` call. Plays are labelled with their animation names
+and, when the scene passes an object with an ``action`` attribute (like
+QuickSortBars' `Event`) to a ``build_*`` method, with that action.
+
+It writes three files:
+  <Scene>.profile.json  totals per stage, per play and per action
+  <Scene>.trace.json    Chrome trace events (chrome://tracing, Perfetto, speedscope)
+  <Scene>.folded        collapsed stacks for flamegraph.pl / inferno / speedscope
+
+Allocations are counted as net allocated memory blocks by default, which is
+cheap enough to leave on. ``trace_allocations=True`` uses tracemalloc for
+byte counts and per-play peaks instead (much slower).
+
+Run with:
+  python render_profiler.py quicksort.py QuickSortBars -q l
+  manim -qh render_profiler.py QuickSortProfiled
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from manim import *
+
+from quicksort import QuickSortBars
+
+
+@dataclass
+class Span:
+    name: str
+    path: str  # ";"-joined stack, flame-graph style
+    start: float
+    duration: float
+    self_time: float
+    thread: int
+    play: int | None
+    allocated: int  # blocks, or bytes with trace_allocations
+
+
+@dataclass
+class PlayRecord:
+    index: int
+    animations: list[str]
+    tag: dict[str, Any]
+    start: float
+    wall: float = 0.0
+    run_time: float = 0.0
+    frames: int = 0
+    allocated: int = 0
+    peak_bytes: int | None = None
+    stages: dict[str, float] = field(default_factory=dict)
+
+
+class RenderProfiler:
+    """
+    Instruments manim's render pipeline while active.
+
+    Usage:
+        with RenderProfiler() as profiler:
+            scene = QuickSortBars()
+            scene.render()
+        profiler.write("media/profiles", "QuickSortBars")
+    """
+
+    def __init__(self, trace_allocations: bool = False):
+        self.trace_allocations = trace_allocations
+        self.spans: list[Span] = []
+        self.plays: list[PlayRecord] = []
+        self._tag: dict[str, Any] = {}
+        self._current_play: int | None = None
+        self._local = threading.local()
+        self._patches: list[tuple[Any, str, Any]] = []
+        self._origin = 0.0
+        self._span_cost = 0.0
+
+    def __enter__(self) -> RenderProfiler:
+        self.install()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.uninstall()
+
+    def install(self) -> None:
+        from manim.renderer import cairo_renderer
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._origin = time.perf_counter()
+        self._span_cost = self._calibrate()
+
+        stages = [
+            (Scene, "compile_animation_data", "compile"),
+            (cairo_renderer, "get_hash_from_play_call", "hash"),
+            (Scene, "begin_animations", "begin"),
+            (Scene, "update_to_time", "interpolate"),
+            (CairoRenderer, "update_frame", "rasterize"),
+            (CairoRenderer, "add_frame", "write_frame"),
+            (SceneFileWriter, "encode_and_write_frame", "encode"),
+            (SceneFileWriter, "end_animation", "flush_encoder"),
+            (SceneFileWriter, "combine_to_movie", "combine"),
+            (Text, "__init__", "Text"),
+            (MarkupText, "__init__", "MarkupText"),
+            (SingleStringMathTex, "__init__", "Tex"),
+        ]
+        try:
+            for owner, attr, stage in stages:
+                if attr not in vars(owner):
+                    # Renamed or removed in this manim version (e.g.
+                    # encode_and_write_frame since 0.21): leave the stage out.
+                    logger.debug("RenderProfiler: no %s.%s, skipping stage %r", owner.__name__, attr, stage)
+                    continue
+                self._patch(owner, attr, self._wrap(getattr(owner, attr), stage))
+            self._patch(Scene, "play", self._wrap_play(Scene.play))
+            self._patch(Scene, "render", self._wrap_render(Scene.render))
+        except BaseException:
+            self.uninstall()  # never leave manim half-patched
+            raise
+
+    def uninstall(self) -> None:
+        for owner, attr, original in reversed(self._patches):
+            setattr(owner, attr, original)
+        self._patches.clear()
+        if self.trace_allocations:
+            tracemalloc.stop()
+
+    def tag(self, **fields: Any) -> None:
+        """Label the following plays, e.g. ``profiler.tag(action="swap")``."""
+        self._tag = fields
+
+    def watch_scene(self, scene: Scene) -> None:
+        """Time the scene's own ``setup``/``construct``/``tear_down`` and ``build_*`` methods."""
+        for name in dir(type(scene)):
+            if name in ("setup", "construct", "tear_down") or name.startswith("build_"):
+                method = getattr(scene, name)
+                if callable(method):
+                    setattr(scene, name, self._wrap(method, name, tags_from_args=name.startswith("build_")))
+
+    # -- recording -----------------------------------------------------------
+
+    def _patch(self, owner: Any, attr: str, replacement: Any) -> None:
+        self._patches.append((owner, attr, owner.__dict__[attr]))
+        setattr(owner, attr, replacement)
+
+    def _allocated(self) -> int:
+        if self.trace_allocations:
+            return tracemalloc.get_traced_memory()[0]
+        return sys.getallocatedblocks()
+
+    def _enter(self, name: str) -> list:
+        stack = self._local.__dict__.setdefault("stack", [])
+        entry = [name, time.perf_counter(), self._allocated(), 0.0]
+        stack.append(entry)
+        return entry
+
+    def _exit(self, entry: list) -> None:
+        end = time.perf_counter()
+        stack = self._local.stack
+        path = ";".join(e[0] for e in stack)
+        stack.pop()
+        name, start, allocated, child_time = entry
+        duration = end - start
+        if stack:
+            stack[-1][3] += duration
+        self.spans.append(
+            Span(
+                name,
+                path,
+                start - self._origin,
+                duration,
+                duration - child_time,
+                threading.get_ident(),
+                self._current_play,
+                self._allocated() - allocated,
+            )
+        )
+
+    def _wrap(self, func: Callable, stage: str, tags_from_args: bool = False) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if tags_from_args:
+                for arg in args:
+                    if hasattr(arg, "action"):
+                        self._tag = {"action": arg.action, "step": getattr(arg, "step", None)}
+                        break
+            entry = self._enter(stage)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit(entry)
+
+        return wrapper
+
+    def _wrap_play(self, play: Callable) -> Callable:
+        @functools.wraps(play)
+        def wrapper(scene, *args, **kwargs):
+            record = PlayRecord(len(self.plays), [], dict(self._tag), time.perf_counter() - self._origin)
+            self.plays.append(record)
+            self._current_play = record.index
+            if self.trace_allocations:
+                tracemalloc.reset_peak()
+            entry = self._enter("play")
+            try:
+                return play(scene, *args, **kwargs)
+            finally:
+                self._exit(entry)
+                self._current_play = None
+                span = self.spans[-1]
+                record.wall = span.duration
+                record.allocated = span.allocated
+                record.animations = [type(a).__name__ for a in getattr(scene, "animations", None) or []]
+                record.run_time = float(getattr(scene, "duration", 0.0))
+                record.frames = round(record.run_time * config.frame_rate)
+                if self.trace_allocations:
+                    record.peak_bytes = tracemalloc.get_traced_memory()[1]
+
+        return wrapper
+
+    def _wrap_render(self, render: Callable) -> Callable:
+        @functools.wraps(render)
+        def wrapper(scene, *args, **kwargs):
+            self.watch_scene(scene)
+            entry = self._enter("render")
+            try:
+                return render(scene, *args, **kwargs)
+            finally:
+                self._exit(entry)
+
+        return wrapper
+
+    def _calibrate(self, n: int = 2000) -> float:
+        """Measured cost of one empty span, used to estimate profiler overhead."""
+        start = time.perf_counter()
+        for _ in range(n):
+            self._exit(self._enter("calibrate"))
+        cost = (time.perf_counter() - start) / n
+        del self.spans[-n:]
+        return cost
+
+    # -- reporting -----------------------------------------------------------
+
+    def report(self, scene_name: str = "") -> dict[str, Any]:
+        main_thread = threading.main_thread().ident
+        for play in self.plays:
+            play.stages = {}
+        stages: dict[str, dict[str, float]] = defaultdict(lambda: {"calls": 0, "total_s": 0.0, "self_s": 0.0})
+        for span in self.spans:
+            key = span.name if span.thread == main_thread else f"{span.name} (thread)"
+            stage = stages[key]
+            stage["calls"] += 1
+            stage["total_s"] += span.duration
+            stage["self_s"] += span.self_time
+            stage["allocated"] = stage.get("allocated", 0) + span.allocated
+            if span.play is not None and span.thread == main_thread and span.name != "play":
+                play = self.plays[span.play]
+                play.stages[span.name] = play.stages.get(span.name, 0.0) + span.self_time
+
+        by_action: dict[str, dict[str, float]] = defaultdict(lambda: {"plays": 0, "wall_s": 0.0, "frames": 0})
+        for play in self.plays:
+            group = by_action[str(play.tag.get("action", "untagged"))]
+            group["plays"] += 1
+            group["wall_s"] += play.wall
+            group["frames"] += play.frames
+
+        render_s = sum(s.duration for s in self.spans if s.name == "render")
+        play_s = sum(p.wall for p in self.plays)
+        return {
+            "scene": scene_name,
+            "render_s": round(render_s, 6),
+            "outside_plays_s": round(render_s - play_s, 6),
+            "allocations": "tracemalloc bytes" if self.trace_allocations else "allocated blocks",
+            "profiler": {
+                "spans": len(self.spans),
+                "estimated_overhead_s": round(len(self.spans) * self._span_cost, 6),
+            },
+            "stages": {k: _rounded(v) for k, v in sorted(stages.items(), key=lambda kv: -kv[1]["self_s"])},
+            "by_action": {k: _rounded(v) for k, v in sorted(by_action.items(), key=lambda kv: -kv[1]["wall_s"])},
+            "plays": [_rounded(asdict(p)) for p in self.plays],
+        }
+
+    def chrome_trace(self) -> dict[str, Any]:
+        events = []
+        threads = {span.thread for span in self.spans}
+        for tid in threads:
+            name = "main" if tid == threading.main_thread().ident else "encoder"
+            events.append({"name": "thread_name", "ph": "M", "pid": 0, "tid": tid, "args": {"name": name}})
+        for span in self.spans:
+            event = {
+                "name": span.name,
+                "cat": "stage",
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": 0,
+                "tid": span.thread,
+                "args": {"allocated": span.allocated},
+            }
+            if span.name == "play" and span.play is not None:
+                play = self.plays[span.play]
+                event["name"] = _play_label(play)
+                event["args"].update(index=play.index, animations=play.animations, **play.tag)
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def folded_stacks(self) -> str:
+        """Self time per stack in microseconds, one ``a;b;c value`` line each."""
+        totals: dict[str, float] = defaultdict(float)
+        for span in self.spans:
+            frames = span.path.split(";")
+            if span.play is not None and "play" in frames:
+                # Group plays by label so the graph shows actions, not indices.
+                frames[frames.index("play")] = _play_label(self.plays[span.play])
+            totals[";".join(frames)] += span.self_time
+        return "".join(f"{path} {round(t * 1e6)}\n" for path, t in sorted(totals.items()) if t > 0)
+
+    def write(self, out_dir: Path | str, scene_name: str) -> dict[str, Path]:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        paths = {
+            "report": out_dir / f"{scene_name}.profile.json",
+            "trace": out_dir / f"{scene_name}.trace.json",
+            "folded": out_dir / f"{scene_name}.folded",
+        }
+        paths["report"].write_text(json.dumps(self.report(scene_name), indent=2), encoding="utf-8")
+        paths["trace"].write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        paths["folded"].write_text(self.folded_stacks(), encoding="utf-8")
+        return paths
+
+    def summary(self, top: int = 8) -> str:
+        report = self.report()
+        lines = [f"render {report['render_s']:.2f}s, {len(self.plays)} plays", f"{'stage':<24}{'self s':>10}{'calls':>8}"]
+        for name, stage in list(report["stages"].items())[:top]:
+            lines.append(f"{name:<24}{stage['self_s']:>10.3f}{stage['calls']:>8}")
+        return "\n".join(lines)
+
+
+def _play_label(play: PlayRecord) -> str:
+    if "action" in play.tag:
+        return f"play:{play.tag['action']}"
+    return "play:" + "+".join(sorted(set(play.animations))) if play.animations else "play"
+
+
+def _rounded(values: dict[str, Any]) -> dict[str, Any]:
+    return {
+        k: round(v, 6) if isinstance(v, float) else _rounded(v) if isinstance(v, dict) else v
+        for k, v in values.items()
+    }
+
+
+class ProfiledScene(Scene):
+    """Mixin that profiles every render and writes the report to ``media/profiles``."""
+
+    trace_allocations = False
+
+    def render(self, preview: bool = False):
+        with RenderProfiler(self.trace_allocations) as profiler:
+            result = super().render(preview)
+        paths = profiler.write(Path(config.media_dir) / "profiles", type(self).__name__)
+        logger.info("Render profile written to %(path)s", {"path": f"'{paths['report']}'"})
+        return result
+
+
+class QuickSortProfiled(ProfiledScene, QuickSortBars):
+    """QuickSortBars with per-play and per-action timing."""
+
+
+def main(argv: list[str] | None = None) -> None:
+    import lazy_manim
+
+    parser = argparse.ArgumentParser(description="Render a scene and write a per-play / per-stage profile.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=lazy_manim.QUALITIES, default="l")
+    parser.add_argument("--out", type=Path, default=Path("media") / "profiles")
+    parser.add_argument("--trace-allocations", action="store_true", help="byte-accurate, much slower")
+    args = parser.parse_args(argv)
+
+    # Cached animations skip every stage worth measuring.
+    with RenderProfiler(args.trace_allocations) as profiler:
+        lazy_manim.render(args.file, args.scene, args.quality, disable_caching=True)
+    paths = profiler.write(args.out, args.scene)
+    print(profiler.summary())
+    for kind, path in paths.items():
+        print(f"{kind:>7}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Multi-panel "sorting race": several algorithms on one input, one clock.
+
+Every panel replays an event stream (the same `Event` records QuickSortBars
+uses) in its own sub-viewport. All panels share one background and legend,
+drawn as a static layer: the renderer rasterizes it once per play instead of
+once per frame. Each panel shows its event at the current global time using
+`build_compact_bars` (one mobject per color instead of a bar, label and
+index per element), so a 4x4 grid costs far less than 16 separate scenes.
+
+Run with:
+  manim -pql sorting_race.py SortingRace
+  manim -pql sorting_race.py SortingRaceGrid
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import random
+from typing import Callable, Sequence
+
+from manim import *
+
+from quicksort import Event, EventLog, QuickSortBars
+
+
+class EventRecorder:
+    """Collects `Event` snapshots into an `EventLog` while a sorting algorithm runs."""
+
+    def __init__(self, source: list[int]):
+        self.events = EventLog(source)
+        self.arr = self.events.current
+        self.comparisons = 0
+
+    def snap(
+        self,
+        action: str,
+        message: str,
+        left: int = 0,
+        right: int | None = None,
+        pivot_index: int | None = None,
+        compare: tuple[int, ...] = (),
+        swap: tuple[int, ...] = (),
+    ) -> None:
+        self.events.record(
+            left,
+            len(self.arr) - 1 if right is None else right,
+            pivot_index,
+            compare,
+            swap,
+            message,
+            action,
+            0,
+            self.comparisons,
+        )
+
+    def compare(self, i: int, j: int, **kwargs) -> bool:
+        """Record a comparison of a[i] > a[j] and return its result."""
+        self.comparisons += 1
+        self.snap("compare", f"Compare a[{i}] and a[{j}]", compare=(i, j), **kwargs)
+        return self.arr[i] > self.arr[j]
+
+    def swap(self, i: int, j: int, **kwargs) -> None:
+        self.events.swap(i, j)
+        self.snap("swap", f"Swap index {i} and {j}", swap=(i, j), **kwargs)
+
+    def fix(self, *indices: int) -> None:
+        self.events.fix(*indices)
+        self.snap("single", f"Index {indices[0]} is fixed")
+
+    def finish(self) -> EventLog:
+        self.events.fix(*range(len(self.arr)))
+        self.snap("done", "Array is fully sorted")
+        return self.events
+
+
+def bubble_sort_events(source: list[int]) -> EventLog:
+    rec = EventRecorder(source)
+    rec.snap("start", "Start: unsorted array")
+    n = len(source)
+    for end in range(n - 1, 0, -1):
+        for j in range(end):
+            if rec.compare(j, j + 1, right=end):
+                rec.swap(j, j + 1, right=end)
+        rec.fix(end)
+    return rec.finish()
+
+
+def insertion_sort_events(source: list[int]) -> EventLog:
+    rec = EventRecorder(source)
+    rec.snap("start", "Start: unsorted array")
+    for i in range(1, len(source)):
+        j = i
+        while j > 0 and rec.compare(j - 1, j, right=i):
+            rec.swap(j - 1, j, right=i)
+            j -= 1
+    return rec.finish()
+
+
+def selection_sort_events(source: list[int]) -> EventLog:
+    rec = EventRecorder(source)
+    rec.snap("start", "Start: unsorted array")
+    n = len(source)
+    for i in range(n - 1):
+        smallest = i
+        for j in range(i + 1, n):
+            if rec.compare(smallest, j, left=i, pivot_index=smallest):
+                smallest = j
+        if smallest != i:
+            rec.swap(i, smallest, left=i)
+        rec.fix(i)
+    return rec.finish()
+
+
+def input_shapes(n: int, seed: int = 7) -> dict[str, list[int]]:
+    rng = random.Random(seed)
+    shuffled = rng.sample(range(1, n + 1), n)
+    nearly = list(range(1, n + 1))
+    for _ in range(max(1, n // 8)):
+        i = rng.randrange(n - 1)
+        nearly[i], nearly[i + 1] = nearly[i + 1], nearly[i]
+    return {
+        "random": shuffled,
+        "reversed": list(range(n, 0, -1)),
+        "nearly sorted": nearly,
+        "few unique": [rng.choice((2, 5, 8, 11)) * n // 11 + 1 for _ in range(n)],
+    }
+
+
+class SortingRace(QuickSortBars):
+    """Quick, bubble, insertion and selection sort racing on the same input."""
+
+    GRID_TOP = 2.75
+    GRID_BOTTOM = -3.85
+    GRID_HALF_WIDTH = 6.85
+    RACE_SECONDS = 16.0  # the slowest panel finishes after this long
+    COLOR_SLOTS = 6  # colors color_for_index can return, i.e. most mobjects build_compact_bars makes
+
+    def races(self) -> list[tuple[str, Sequence[Event]]]:
+        data = input_shapes(24)["random"]
+        return [(name, build(data)) for name, build in self.algorithms().items()]
+
+    def algorithms(self) -> dict[str, Callable[[list[int]], Sequence[Event]]]:
+        return {
+            "Quick sort": self.build_events,
+            "Bubble sort": bubble_sort_events,
+            "Insertion sort": insertion_sort_events,
+            "Selection sort": selection_sort_events,
+        }
+
+    def construct(self) -> None:
+        races = self.races()
+        cols = math.ceil(math.sqrt(len(races)))
+        rows = math.ceil(len(races) / cols)
+        cell_w = 2 * self.GRID_HALF_WIDTH / cols
+        cell_h = (self.GRID_TOP - self.GRID_BOTTOM) / rows
+
+        # One global clock: every panel keeps QuickSortBars pacing, sped up so
+        # the slowest one finishes after RACE_SECONDS.
+        timelines = [self.event_starts(events) for _, events in races]
+        speed = max(starts[-1] for starts in timelines) / self.RACE_SECONDS
+
+        # Static layer first: the renderer treats everything added before the
+        # first mobject with updaters as static and draws it once per play.
+        title = Text("Sorting Race", font_size=40, weight=BOLD, color=WHITE).to_edge(UP, buff=0.2)
+        legend = self.build_legend().scale(0.55).to_corner(UR, buff=0.12)
+        self.add(*self.build_background(), title, legend)
+
+        panels = []
+        for i, (name, events) in enumerate(races):
+            row, col = divmod(i, cols)
+            center = np.array(
+                [-self.GRID_HALF_WIDTH + cell_w * (col + 0.5), self.GRID_TOP - cell_h * (row + 0.5), 0]
+            )
+            frame = RoundedRectangle(corner_radius=0.1, width=cell_w - 0.12, height=cell_h - 0.12)
+            frame.set_fill("#101827", opacity=0.84).set_stroke(GRAY_C, width=1.2, opacity=0.8)
+            frame.move_to(center)
+            label = Text(name, font_size=20 if rows <= 2 else 13, color=GRAY_A)
+            label.next_to(frame.get_corner(UL), DR, buff=0.08)
+            self.add(frame, label)
+            panels.append((frame, label, events, timelines[i]))
+
+        # Dynamic layer: one top-level group per panel, all driven by the same clock.
+        clock = ValueTracker(0)
+        for frame, label, events, starts in panels:
+            self.add(self.build_panel(frame, label, events, [t / speed for t in starts], clock))
+
+        self.play(clock.animate.set_value(self.RACE_SECONDS), run_time=self.RACE_SECONDS, rate_func=linear)
+        self.wait(1.5)
+
+    def build_panel(
+        self,
+        frame: Mobject,
+        label: Mobject,
+        events: Sequence[Event],
+        starts: list[float],
+        clock: ValueTracker,
+    ) -> VGroup:
+        """Bars that follow the clock, plus a badge shown once the panel's last event is reached."""
+        max_value = max(events[0].array)
+        total = len(events[0].array)
+        width = frame.width * 0.9
+        bottom = frame.get_bottom()[1] + 0.18
+        scale = (label.get_bottom()[1] - 0.12 - bottom) / (0.55 + self.MAX_BAR_HEIGHT)
+        x_shift = frame.get_center()[0] * RIGHT
+
+        last = events[-1]
+        badge = Text(
+            f"done at {starts[-1]:.1f}s  ·  {last.comparisons} cmp  ·  {last.swaps} swaps",
+            font_size=label.font_size * 0.8,
+            color=GREEN_A,
+        )
+        badge.next_to(label, DOWN, buff=0.06, aligned_edge=LEFT).set_opacity(0)
+        # The renderer draws the family it flattened when the play started, so
+        # the bar mobjects must persist: each event rewrites their points in place.
+        slots = VGroup(*[VMobject(fill_opacity=0.95, stroke_width=0) for _ in range(self.COLOR_SLOTS)])
+        panel = VGroup(slots, badge)
+        panel.shown = -1
+
+        def show(group: VGroup) -> None:
+            k = max(0, bisect.bisect_right(starts, clock.get_value()) - 1)
+            if k == group.shown:
+                return  # most frames: nothing changed in this panel
+            group.shown = k
+            bars = self.build_compact_bars(events[k], total, max_value, width=width, scale=scale, baseline_y=bottom)
+            bars.shift(x_shift)
+            for i, slot in enumerate(slots):
+                if i < len(bars):
+                    slot.set_points(bars[i].points).set_fill(bars[i].get_fill_color(), opacity=0.95)
+                else:
+                    slot.clear_points()
+            badge.set_opacity(1 if k == len(events) - 1 else 0)
+
+        show(panel)
+        panel.add_updater(show)
+        return panel
+
+    def event_starts(self, events: Sequence[Event]) -> list[float]:
+        """Start time of every event at QuickSortBars pacing; the last one is when the panel finishes."""
+        starts = np.cumsum([0.0] + [self.duration_for(event.action) for event in events[:-1]])
+        return starts.tolist()
+
+
+class SortingRaceGrid(SortingRace):
+    """4x4 grid: four algorithms (columns) on four input shapes (rows)."""
+
+    def races(self) -> list[tuple[str, Sequence[Event]]]:
+        shapes = input_shapes(16)
+        return [
+            (f"{name} / {shape}", build(data))
+            for shape, data in shapes.items()
+            for name, build in self.algorithms().items()
+        ]
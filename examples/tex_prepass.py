@@ -0,0 +1,232 @@
+"""
+Batched LaTeX compilation with a shared, size-bounded TeX cache.
+
+Every `MathTex`/`Tex` normally runs latex + dvisvgm on its own, one after
+another, the first time a scene is rendered. `tex_prepass` builds the scene's
+TeX mobjects once against placeholder SVGs to collect every expression, then
+compiles all cache misses in parallel. The real build that follows is all
+cache hits.
+
+Manim names each compiled file after a hash of its full TeX source, so the TeX
+directory is already content-addressed. `use_shared_tex_cache` points it at a
+directory shared by every project (and syncable between machines), and
+`prune_tex_cache` keeps it under a size limit.
+
+Run with: manim -pql tex_prepass.py BatchedMathExample
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, TypeVar
+
+from manim import *
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import compile_tex, convert_to_svg, generate_tex_file
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("MANIM_TEX_CACHE", Path.home() / ".cache" / "manim-tex"))
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+# Intermediates younger than this may belong to a compile still running elsewhere.
+DEFAULT_GRACE_SECONDS = 3600
+
+# One tiny path. It has none of the SVG groups MathTex splits its parts by,
+# so the collect pass silences the errors that causes.
+_PLACEHOLDER_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"><path d="M0 0H1V1Z"/></svg>'
+_INTERMEDIATE_SUFFIXES = (".aux", ".log", ".dvi", ".xdv", ".pdf")
+
+
+@dataclass(frozen=True)
+class TexJob:
+    expression: str
+    environment: str | None
+    tex_template: TexTemplate
+
+
+@dataclass
+class PrepassStats:
+    expressions: int = 0
+    hits: int = 0
+    compiled: int = 0
+
+
+def use_shared_tex_cache(cache_dir: Path | str = DEFAULT_CACHE_DIR) -> Path:
+    """Point manim's TeX directory at a cache shared across projects."""
+    path = Path(cache_dir).expanduser().absolute()
+    path.mkdir(parents=True, exist_ok=True)
+    config.tex_dir = path
+    return path
+
+
+class _DropRecords(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        return False
+
+
+@contextmanager
+def collect_tex() -> Iterator[list[TexJob]]:
+    """
+    Record every TeX expression built inside the block instead of compiling it.
+
+    Mobjects built inside are placeholders: their parts cannot be looked up,
+    and manim's log messages about that are dropped.
+    """
+    jobs: list[TexJob] = []
+    original = tex_mobject.tex_to_svg_file
+    quiet = _DropRecords()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        placeholder = Path(tmp) / "placeholder.svg"
+        placeholder.write_text(_PLACEHOLDER_SVG, encoding="utf-8")
+
+        def record(expression, environment=None, tex_template=None):
+            jobs.append(TexJob(expression, environment, tex_template or config["tex_template"]))
+            return placeholder
+
+        tex_mobject.tex_to_svg_file = record
+        logger.addFilter(quiet)
+        try:
+            yield jobs
+        finally:
+            logger.removeFilter(quiet)
+            tex_mobject.tex_to_svg_file = original
+
+
+def compile_tex_jobs(jobs: list[TexJob], max_workers: int | None = None) -> PrepassStats:
+    """Compile every uncached job, running latex/dvisvgm processes in parallel."""
+    stats = PrepassStats()
+    pending: dict[Path, TexJob] = {}
+
+    for job in jobs:
+        stats.expressions += 1
+        tex_file = generate_tex_file(job.expression, job.environment, job.tex_template)
+        svg_file = tex_file.with_suffix(".svg")
+        if svg_file.exists():
+            stats.hits += 1
+            svg_file.touch()  # keeps the entry fresh for prune_tex_cache
+        else:
+            pending[tex_file] = job
+
+    def compile_one(item: tuple[Path, TexJob]) -> Path:
+        tex_file, job = item
+        template = job.tex_template
+        output = compile_tex(tex_file, template.tex_compiler, template.output_format)
+        svg_file = convert_to_svg(output, template.output_format)
+        if not config["no_latex_cleanup"]:
+            for suffix in _INTERMEDIATE_SUFFIXES:
+                tex_file.with_suffix(suffix).unlink(missing_ok=True)
+        return svg_file
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            stats.compiled = len(list(pool.map(compile_one, pending.items())))
+    return stats
+
+
+def tex_prepass(builder: Callable[[], T], max_workers: int | None = None) -> T:
+    """
+    Build TeX mobjects with all of their expressions compiled up front.
+
+    ``builder`` runs twice: once against placeholders to collect expressions,
+    and once for real after the parallel compile. Keep it free of side effects
+    other than creating mobjects.
+    """
+    with collect_tex() as jobs:
+        try:
+            builder()
+        except Exception as exc:
+            # E.g. set_color_by_tex on a placeholder. Expressions after this
+            # point compile one by one in the real build, which also
+            # reports any genuine error.
+            logger.debug("TeX prepass: collect pass stopped early: %r", exc)
+    stats = compile_tex_jobs(jobs, max_workers=max_workers)
+    logger.info(
+        "TeX prepass: %(expressions)d expressions, %(hits)d cached, %(compiled)d compiled",
+        vars(stats),
+    )
+    return builder()
+
+
+def prune_tex_cache(
+    cache_dir: Path | str | None = None,
+    max_bytes: int = DEFAULT_CACHE_BYTES,
+    grace_seconds: float = DEFAULT_GRACE_SECONDS,
+) -> int:
+    """
+    Evict least recently used entries until the cache fits in ``max_bytes``. Returns bytes freed.
+
+    Intermediate files (.aux, .dvi, ...) are deleted only once they are older
+    than ``grace_seconds``: the directory is shared, and a younger one may
+    belong to a compile another process is running right now.
+    """
+    root = Path(cache_dir) if cache_dir is not None else config.get_dir("tex_dir")
+    if not root.exists():
+        return 0
+
+    freed = 0
+    cutoff = time.time() - grace_seconds
+    # Leftovers from interrupted compiles are never read again.
+    for path in root.iterdir():
+        if path.suffix not in _INTERMEDIATE_SUFFIXES:
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # cleaned up by its own compile meanwhile
+            continue
+        if stat.st_mtime < cutoff:
+            freed += stat.st_size
+            path.unlink(missing_ok=True)
+
+    entries = []
+    for svg in root.glob("*.svg"):
+        tex = svg.with_suffix(".tex")
+        size = svg.stat().st_size + (tex.stat().st_size if tex.exists() else 0)
+        entries.append((svg.stat().st_mtime, size, svg, tex))
+
+    total = sum(size for _, size, _, _ in entries)
+    for _, size, svg, tex in sorted(entries):
+        if total <= max_bytes:
+            break
+        svg.unlink(missing_ok=True)
+        tex.unlink(missing_ok=True)
+        total -= size
+        freed += size
+    return freed
+
+
+class BatchedMathExample(Scene):
+    """Equation-heavy scene whose formulas compile in one parallel batch."""
+
+    def setup(self):
+        use_shared_tex_cache()
+
+    def construct(self):
+        def build():
+            title = MathTex(r"E = mc^2", font_size=72)
+            identities = VGroup(
+                MathTex(r"\int_{-\infty}^{\infty} e^{-x^2} dx = \sqrt{\pi}"),
+                MathTex(r"\sum_{n=1}^{\infty} \frac{1}{n^2} = \frac{\pi^2}{6}"),
+                MathTex(r"e^{i\pi} + 1 = 0"),
+                MathTex(r"\frac{d}{dx} \sin x = \cos x"),
+                MathTex(r"{{ a^2 }} + {{ b^2 }} = {{ c^2 }}"),
+            ).arrange(DOWN, buff=0.35)
+            return title, identities
+
+        title, identities = tex_prepass(build)
+        title.to_edge(UP)
+        identities.next_to(title, DOWN, buff=0.6)
+
+        self.play(Write(title))
+        self.play(LaggedStart(*[Write(eq) for eq in identities], lag_ratio=0.3))
+        self.wait(1)
+
+    def tear_down(self):
+        prune_tex_cache()
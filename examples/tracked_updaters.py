@@ -0,0 +1,302 @@
+"""
+Dependency-tracked updaters for ValueTracker-driven scenes.
+
+`always_redraw` and `add_updater` run every frame, even when the trackers
+they read have not moved. `TrackedUpdaters` records which ValueTrackers each
+updater reads (and writes), skips updaters whose inputs are unchanged, runs
+the rest in dependency order, and keeps per-updater timing counters.
+
+Run with: manim -pql tracked_updaters.py DashboardReadouts
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from graphlib import CycleError, TopologicalSorter
+from typing import Callable, Iterator
+
+from manim import *
+
+
+@dataclass
+class UpdaterStats:
+    name: str
+    calls: int = 0
+    skips: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+@dataclass
+class _Node:
+    name: str
+    func: Callable[[], None]
+    always: bool
+    reads: dict[int, ValueTracker] = field(default_factory=dict)
+    writes: dict[int, ValueTracker] = field(default_factory=dict)
+    seen: dict[int, float] | None = None
+
+
+class TrackedUpdaters:
+    """
+    Scene-level updater scheduler with dependency tracking.
+
+    Every node runs once (``redraw`` nodes at registration, the rest on the
+    first frame) so its tracker reads and writes can be recorded. Afterwards
+    a node only runs when one of the trackers it read has a different value,
+    or when it is marked ``always=True`` (use that for updaters that also
+    read mobject positions or ``dt``).
+
+    Usage:
+        updaters = TrackedUpdaters()
+        readout = updaters.redraw(lambda: Text(f"{t.get_value():.1f}"))
+        updaters.attach(self)
+    """
+
+    def __init__(self) -> None:
+        self.nodes: list[_Node] = []
+        self.stats: dict[str, UpdaterStats] = {}
+        self._order: list[_Node] | None = None
+        self._scenes: list[Scene] = []
+
+    def add(self, func: Callable[[], None], name: str | None = None, always: bool = False) -> Callable[[], None]:
+        name = name or getattr(func, "__name__", "updater")
+        if name in self.stats:
+            name = f"{name}#{len(self.nodes)}"
+        self.nodes.append(_Node(name=name, func=func, always=always))
+        self.stats[name] = UpdaterStats(name)
+        self._order = None
+        return func
+
+    def redraw(
+        self, builder: Callable[[], Mobject], name: str | None = None, match_center: bool = False
+    ) -> Mobject:
+        """
+        Drop-in for ``always_redraw`` that only rebuilds when inputs change.
+
+        Like ``always_redraw``, every rebuild takes the builder's position. Pass
+        ``match_center=True`` for builders that draw at the origin, so the
+        mobject keeps wherever it was arranged after creation.
+        """
+        holder: list[Mobject] = []
+        self.add(lambda: holder.append(builder()), name=name or "redraw")
+        # Build once through the scheduler so the first frame can skip it.
+        self.run_node(self.nodes[-1])
+        mob = holder.pop()
+
+        def rebuild() -> None:
+            size = len(mob.get_family())
+            mob.become(builder(), match_center=match_center)
+            if len(mob.get_family()) != size:
+                # become() padded the family, e.g. "40" -> "170" needs a glyph more.
+                self._show_new_family_members(mob)
+
+        self.nodes[-1].func = rebuild
+        return _mark_moving(mob)
+
+    def update_object(
+        self, mob: Mobject, func: Callable[[Mobject], object], name: str | None = None
+    ) -> Mobject:
+        """Drop-in for ``mob.add_updater(func)`` with dependency tracking."""
+        self.add(lambda: func(mob), name=name or getattr(func, "__name__", "updater"))
+        return _mark_moving(mob)
+
+    def attach(self, scene: Scene) -> None:
+        self._scenes.append(scene)
+        scene.add_updater(self.update)
+
+    def detach(self, scene: Scene) -> None:
+        scene.remove_updater(self.update)
+        self._scenes.remove(scene)
+
+    def _show_new_family_members(self, mob: Mobject) -> None:
+        # During a play the renderer draws the moving mobjects it collected
+        # when the play began; submobjects added since would stay hidden
+        # until the next play. Append them to that list.
+        for scene in self._scenes:
+            moving = getattr(scene, "moving_mobjects", None)
+            if not moving:
+                continue
+            known = {id(m) for m in moving}
+            if id(mob) in known:
+                moving.extend(m for m in mob.get_family() if id(m) not in known)
+
+    def update(self, dt: float = 0) -> None:
+        self._run_pass()
+        # Newly discovered edges (e.g. on the first frame) reorder the graph;
+        # one more pass lets readers catch up within the same frame.
+        if self._order is None:
+            self._run_pass()
+
+    def _run_pass(self) -> None:
+        for node in self.order():
+            if not node.always and node.seen is not None and self._values(node.reads) == node.seen:
+                self.stats[node.name].skips += 1
+                continue
+            self.run_node(node)
+
+    def run_node(self, node: _Node) -> None:
+        start = time.perf_counter()
+        reads, writes = self._record(node.func)
+        elapsed = time.perf_counter() - start
+
+        stats = self.stats[node.name]
+        stats.calls += 1
+        stats.total_time += elapsed
+        stats.max_time = max(stats.max_time, elapsed)
+
+        if reads.keys() != node.reads.keys() or writes.keys() != node.writes.keys():
+            self._order = None
+        node.reads, node.writes = reads, writes
+        node.seen = self._values(reads)
+
+    def order(self) -> list[_Node]:
+        """Nodes sorted so that tracker writers run before their readers."""
+        if self._order is not None:
+            return self._order
+
+        writers: dict[int, list[int]] = {}
+        for idx, node in enumerate(self.nodes):
+            for key in node.writes:
+                writers.setdefault(key, []).append(idx)
+
+        graph = TopologicalSorter()
+        for idx, node in enumerate(self.nodes):
+            deps = {w for key in node.reads for w in writers.get(key, ()) if w != idx}
+            graph.add(idx, *deps)
+
+        try:
+            ranked = list(graph.static_order())
+        except CycleError as exc:
+            names = [self.nodes[i].name for i in exc.args[1]]
+            raise ValueError(f"Updater dependency cycle: {' -> '.join(names)}") from exc
+
+        self._order = [self.nodes[i] for i in ranked]
+        return self._order
+
+    def report(self) -> str:
+        lines = [f"{'updater':<24}{'calls':>8}{'skips':>8}{'mean ms':>10}{'max ms':>10}"]
+        for node in self.order():
+            s = self.stats[node.name]
+            lines.append(
+                f"{s.name:<24}{s.calls:>8}{s.skips:>8}{s.mean_time * 1000:>10.3f}{s.max_time * 1000:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _values(trackers: dict[int, ValueTracker]) -> dict[int, float]:
+        return {key: tracker.get_value() for key, tracker in trackers.items()}
+
+    @staticmethod
+    def _record(func: Callable[[], object]) -> tuple[dict[int, ValueTracker], dict[int, ValueTracker]]:
+        reads: dict[int, ValueTracker] = {}
+        writes: dict[int, ValueTracker] = {}
+        with _tracking(reads, writes):
+            func()
+        # A tracker the updater writes before reading is an output, not an input.
+        for key in writes:
+            reads.pop(key, None)
+        return reads, writes
+
+
+def _mark_moving(mob: Mobject) -> Mobject:
+    # The scheduler runs as a scene updater, which the renderer does not see.
+    # A no-op mobject updater keeps the mobject out of the static layer that
+    # Cairo draws once per play.
+    mob.add_updater(lambda m: None)
+    return mob
+
+
+@contextmanager
+def _tracking(reads: dict[int, ValueTracker], writes: dict[int, ValueTracker]) -> Iterator[None]:
+    # ComplexValueTracker overrides both methods without calling the base ones.
+    originals = [
+        (cls, cls.__dict__["get_value"], cls.__dict__["set_value"])
+        for cls in (ValueTracker, ComplexValueTracker)
+        if "get_value" in cls.__dict__ and "set_value" in cls.__dict__
+    ]
+
+    def patch(original_get: Callable, original_set: Callable) -> tuple[Callable, Callable]:
+        def get_value(tracker: ValueTracker) -> float:
+            if id(tracker) not in writes:
+                reads[id(tracker)] = tracker
+            return original_get(tracker)
+
+        def set_value(tracker: ValueTracker, value: float) -> ValueTracker:
+            writes[id(tracker)] = tracker
+            return original_set(tracker, value)
+
+        return get_value, set_value
+
+    for cls, original_get, original_set in originals:
+        cls.get_value, cls.set_value = patch(original_get, original_set)
+    try:
+        yield
+    finally:
+        for cls, original_get, original_set in originals:
+            cls.get_value, cls.set_value = original_get, original_set
+
+
+def make_gauge(label, value, color, scale=1):
+    """Horizontal bar gauge with a numeric readout (TeX-free)."""
+    track = Rectangle(width=2.4, height=0.22, stroke_color=GRAY, stroke_width=1.5)
+    fill = Rectangle(
+        width=max(0.01, 2.4 * min(value * scale, 100) / 100),
+        height=0.22,
+        stroke_width=0,
+        fill_color=color,
+        fill_opacity=0.8,
+    )
+    fill.align_to(track, LEFT)
+    text = Text(f"{label} x{scale}: {value * scale:.0f}", font_size=16)
+    text.next_to(track, UP, buff=0.08).align_to(track, LEFT)
+    return VGroup(track, fill, text)
+
+
+class DashboardReadouts(Scene):
+    """Twelve gauges driven by three trackers; only the moving ones rebuild."""
+
+    def construct(self):
+        cpu = ValueTracker(20)
+        mem = ValueTracker(40)
+        net = ValueTracker(10)
+        load = ValueTracker(0)  # derived: written by an updater, read by others
+
+        updaters = TrackedUpdaters()
+
+        def derive_load():
+            load.set_value(0.5 * cpu.get_value() + 0.3 * mem.get_value() + 0.2 * net.get_value())
+
+        # Registered after its readers on purpose: the scheduler reorders it.
+        sources = [("cpu", cpu, BLUE), ("mem", mem, GREEN), ("net", net, ORANGE), ("load", load, RED)]
+        gauges = VGroup()
+        for label, tracker, color in sources:
+            for scale in (1, 2, 4):
+                gauges.add(
+                    updaters.redraw(
+                        lambda t=tracker, c=color, k=scale, s=label: make_gauge(s, t.get_value(), c, k),
+                        name=f"{label}x{scale}",
+                        match_center=True,  # make_gauge draws at the origin
+                    )
+                )
+        updaters.add(derive_load, name="derive_load")
+
+        gauges.arrange_in_grid(rows=4, cols=3, buff=(0.6, 0.35))
+        updaters.attach(self)
+
+        self.add(gauges)
+        self.play(cpu.animate.set_value(85), run_time=2)
+        self.play(net.animate.set_value(60), run_time=1.5)
+        self.wait(0.5)
+        self.play(mem.animate.set_value(70), cpu.animate.set_value(30), run_time=2)
+        self.wait(1)
+
+        updaters.detach(self)
+        logger.info("Updater stats:\n%s", updaters.report())
+